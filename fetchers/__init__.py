@@ -1,7 +1,7 @@
 """
 Fetchers package - Parsers individuais para cada fornecedor de dados de veículos
 """
-from .base_parser import BaseParser
+from .base_parser import BaseParser, RawVehicle
 from .altimus_parser import AltimusParser
 from .autocerto_parser import AutocertoParser
 from .autoconf_parser import AutoconfParser
@@ -23,6 +23,7 @@ from .carburgo_parser import CarburgoParser
 __all__ = [
     'RevendaiParser',
     'BaseParser',
+    'RawVehicle',
     'AltimusParser',
     'AutocertoParser', 
     'AutoconfParser',
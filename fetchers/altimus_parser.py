@@ -9,9 +9,11 @@ import re
 class AltimusParser(BaseParser):
     """Parser para dados do Altimus"""
     
+    URL_FRAGMENTS = ("altimus.com.br",)
+    
     def can_parse(self, data: Any, url: str) -> bool:
         """Verifica se pode processar dados do Altimus"""
-        return "altimus.com.br" in url.lower()
+        return self.matches_url(url.lower())
     
     def parse(self, data: Any, url: str) -> List[Dict]:
         """Processa dados do Altimus"""
@@ -19,28 +21,38 @@ class AltimusParser(BaseParser):
         if isinstance(veiculos, dict):
             veiculos = [veiculos]
         
+        # Métodos usados no laço ligados a variáveis locais
+        _norm = self.normalize_vehicle
+        _preco = self.converter_preco
+        _cat = self.definir_categoria_veiculo
+        _moto = self.inferir_cilindrada_e_categoria_moto
+        _opcionais = self._parse_opcionais
+        _motor = self._extract_motor_from_version
+        _tipo = self._determine_tipo
+        _cambio = self._normalize_cambio
         parsed_vehicles = []
+        parsed_vehicles_append = parsed_vehicles.append
         for v in veiculos:
             modelo_veiculo = v.get("modelo")
             versao_veiculo = v.get("versao")
-            opcionais_veiculo = self._parse_opcionais(v.get("opcionais"))
+            opcionais_veiculo = _opcionais(v.get("opcionais"))
             combustivel_veiculo = v.get("combustivel")
             
             # Determina se é moto ou carro - CORREÇÃO PARA EVITAR ERRO DE None
             tipo_veiculo = v.get("tipo", "")
             tipo_veiculo_lower = tipo_veiculo.lower() if tipo_veiculo else ""
-            is_moto = "moto" in tipo_veiculo_lower or "motocicleta" in tipo_veiculo_lower
+            is_moto = "moto" in tipo_veiculo_lower
             
             if is_moto:
-                cilindrada_final, categoria_final = self.inferir_cilindrada_e_categoria_moto(
+                cilindrada_final, categoria_final = _moto(
                     modelo_veiculo, versao_veiculo
                 )
             else:
-                categoria_final = self.definir_categoria_veiculo(modelo_veiculo, opcionais_veiculo)
+                categoria_final = _cat(modelo_veiculo, opcionais_veiculo)
                 cilindrada_final = None
             
             # Determina o tipo final do veículo
-            tipo_final = self._determine_tipo(tipo_veiculo, is_moto)
+            tipo_final = _tipo(tipo_veiculo, is_moto)
             
             # NOVA REGRA: Se tipo for 'moto' ou 'eletrico' e combustível for 'Elétrico', categoria = "Scooter Eletrica"
             if (tipo_final in ['moto', 'eletrico'] and 
@@ -48,7 +60,7 @@ class AltimusParser(BaseParser):
                 str(combustivel_veiculo).lower() == 'elétrico'):
                 categoria_final = "Scooter Eletrica"
             
-            parsed = self.normalize_vehicle({
+            parsed = _norm({
                 "id": v.get("id"),
                 "tipo": tipo_final,
                 "titulo": None,
@@ -60,25 +72,19 @@ class AltimusParser(BaseParser):
                 "km": v.get("km"),
                 "cor": v.get("cor"),
                 "combustivel": combustivel_veiculo,
-                "cambio": self._normalize_cambio(v.get("cambio")),
-                "motor": self._extract_motor_from_version(versao_veiculo),
+                "cambio": _cambio(v.get("cambio")),
+                "motor": _motor(versao_veiculo),
                 "portas": v.get("portas"),
                 "categoria": categoria_final,
                 "cilindrada": cilindrada_final,
-                "preco": self.converter_preco(v.get("valorVenda") or v.get("preco")),
+                "preco": _preco(v.get("valorVenda") or v.get("preco")),
                 "opcionais": opcionais_veiculo,
                 "fotos": v.get("fotos", [])
             })
-            parsed_vehicles.append(parsed)
+            parsed_vehicles_append(parsed)
         
         return parsed_vehicles
     
-    def _parse_opcionais(self, opcionais: Any) -> str:
-        """Processa os opcionais do Altimus"""
-        if isinstance(opcionais, list):
-            return ", ".join(str(item) for item in opcionais if item)
-        return str(opcionais) if opcionais else ""
-    
     def _determine_tipo(self, tipo_original: str, is_moto: bool) -> str:
         """Determina o tipo final do veículo"""
         if not tipo_original:
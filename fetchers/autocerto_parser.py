@@ -9,9 +9,11 @@ import re
 class AutocertoParser(BaseParser):
     """Parser para dados do Autocerto"""
     
+    URL_FRAGMENTS = ("autocerto.com",)
+    
     def can_parse(self, data: Any, url: str) -> bool:
         """Verifica se pode processar dados do Autocerto"""
-        return "autocerto.com" in url.lower()
+        return self.matches_url(url.lower())
     
     def parse(self, data: Any, url: str) -> List[Dict]:
         """Processa dados do Autocerto"""
@@ -19,25 +21,34 @@ class AutocertoParser(BaseParser):
         if isinstance(veiculos, dict):
             veiculos = [veiculos]
         
+        # Métodos usados no laço ligados a variáveis locais
+        _norm = self.normalize_vehicle
+        _preco = self.converter_preco
+        _cat = self.definir_categoria_veiculo
+        _moto = self.inferir_cilindrada_e_categoria_moto
+        _opcionais = self._parse_opcionais
+        _motor = self._extract_motor_from_version
+        _fotos = self._extract_photos
         parsed_vehicles = []
+        parsed_vehicles_append = parsed_vehicles.append
         for v in veiculos:
             modelo_veiculo = v.get("modelo")
             versao_veiculo = v.get("versao")
-            opcionais_veiculo = self._parse_opcionais(v.get("opcionais"))
+            opcionais_veiculo = _opcionais(v.get("opcionais"))
             
             # Determina se é moto ou carro
             tipo_veiculo = v.get("tipoveiculo", "").lower()
-            is_moto = "moto" in tipo_veiculo or "motocicleta" in tipo_veiculo
+            is_moto = "moto" in tipo_veiculo
             
             if is_moto:
-                cilindrada_final, categoria_final = self.inferir_cilindrada_e_categoria_moto(
+                cilindrada_final, categoria_final = _moto(
                     modelo_veiculo, versao_veiculo
                 )
             else:
-                categoria_final = self.definir_categoria_veiculo(modelo_veiculo, opcionais_veiculo)
+                categoria_final = _cat(modelo_veiculo, opcionais_veiculo)
                 cilindrada_final = None
             
-            parsed = self.normalize_vehicle({
+            parsed = _norm({
                 "id": v.get("idveiculo"),
                 "tipo": "moto" if is_moto else v.get("tipoveiculo"),
                 "titulo": None,
@@ -50,27 +61,18 @@ class AutocertoParser(BaseParser):
                 "cor": v.get("cor"),
                 "combustivel": v.get("combustivel"),
                 "cambio": v.get("cambio"),
-                "motor": self._extract_motor_from_version(v.get("versao")),
+                "motor": _motor(v.get("versao")),
                 "portas": v.get("numeroportas"),
                 "categoria": categoria_final,
                 "cilindrada": cilindrada_final,
-                "preco": self.converter_preco(v.get("preco")),
+                "preco": _preco(v.get("preco")),
                 "opcionais": opcionais_veiculo,
-                "fotos": self._extract_photos(v)
+                "fotos": _fotos(v)
             })
-            parsed_vehicles.append(parsed)
+            parsed_vehicles_append(parsed)
         
         return parsed_vehicles
     
-    def _parse_opcionais(self, opcionais: Any) -> str:
-        """Processa os opcionais do Autocerto"""
-        if isinstance(opcionais, dict) and "opcional" in opcionais:
-            opcional = opcionais["opcional"]
-            if isinstance(opcional, list):
-                return ", ".join(str(item) for item in opcional if item)
-            return str(opcional) if opcional else ""
-        return ""
-    
     def _clean_version(self, modelo: str, versao: str) -> str:
         """Limpa a versão removendo informações técnicas redundantes"""
         if not versao:
@@ -94,7 +96,7 @@ class AutocertoParser(BaseParser):
             return None
         
         # Pega a primeira palavra da versão que geralmente é o motor
-        words = versao.strip().split()
+        words = versao.split(None, 1)
         return words[0] if words else None
     
     def _extract_photos(self, v: Dict) -> List[str]:
@@ -107,7 +109,7 @@ class AutocertoParser(BaseParser):
             fotos_foto = [fotos_foto]
         
         return [
-            img["url"].split("?")[0] 
+            img["url"].partition("?")[0] 
             for img in fotos_foto 
             if isinstance(img, dict) and "url" in img
         ]
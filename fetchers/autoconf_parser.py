@@ -9,6 +9,8 @@ import re
 class AutoconfParser(BaseParser):
     """Parser para dados do Autoconf"""
     
+    URL_FRAGMENTS = ("autoconf",)
+    
     # Mapeamento de categorias específico do Autoconf
     CATEGORIA_MAPPING = {
         "conversivel/cupe": "Conversível",
@@ -25,7 +27,7 @@ class AutoconfParser(BaseParser):
     
     def can_parse(self, data: Any, url: str) -> bool:
         """Verifica se pode processar dados do Autoconf"""
-        return "autoconf" in url.lower()
+        return self.matches_url(url.lower())
     
     def parse(self, data: Any, url: str) -> List[Dict]:
         """Processa dados do Autoconf"""
@@ -33,25 +35,33 @@ class AutoconfParser(BaseParser):
         if isinstance(ads, dict): 
             ads = [ads]
         
+        # Métodos usados no laço ligados a variáveis locais
+        _norm = self.normalize_vehicle
+        _preco = self.converter_preco
+        _cat = self.definir_categoria_veiculo
+        _moto = self.inferir_cilindrada_e_categoria_moto
+        _fotos = self._extract_photos
+        _features = self._parse_features
         parsed_vehicles = []
+        parsed_vehicles_append = parsed_vehicles.append
         for v in ads:
             modelo_veiculo = v.get("MODEL")
             versao_veiculo = v.get("VERSION")
-            opcionais_veiculo = self._parse_features(v.get("FEATURES"))
+            opcionais_veiculo = _features(v.get("FEATURES"))
             
             # Determina se é moto ou carro - CORREÇÃO AQUI
             categoria_veiculo = v.get("CATEGORY", "")
             categoria_veiculo_lower = categoria_veiculo.lower() if categoria_veiculo else ""
-            is_moto = categoria_veiculo_lower == "motos" or "moto" in categoria_veiculo_lower
+            is_moto = "moto" in categoria_veiculo_lower
             
             if is_moto:
-                cilindrada_final, categoria_final = self.inferir_cilindrada_e_categoria_moto(
+                cilindrada_final, categoria_final = _moto(
                     modelo_veiculo, versao_veiculo
                 )
                 tipo_final = "moto"
             else:
                 # Primeiro tenta inferir categoria pelo modelo/versão (como no Autocerto)
-                categoria_modelo = self.definir_categoria_veiculo(modelo_veiculo, opcionais_veiculo)
+                categoria_modelo = _cat(modelo_veiculo, opcionais_veiculo)
                 
                 # Se não conseguiu inferir pelo modelo, usa o campo BODY com mapeamento
                 if not categoria_modelo or categoria_modelo == "Não informado":
@@ -64,7 +74,7 @@ class AutoconfParser(BaseParser):
                 cilindrada_final = None
                 tipo_final = "carro" if categoria_veiculo_lower == "carros" else categoria_veiculo
 
-            parsed = self.normalize_vehicle({
+            parsed = _norm({
                 "id": v.get("ID"),
                 "tipo": tipo_final,
                 "titulo": None,
@@ -81,11 +91,11 @@ class AutoconfParser(BaseParser):
                 "portas": v.get("DOORS"),
                 "categoria": categoria_final,
                 "cilindrada": cilindrada_final,
-                "preco": self.converter_preco(v.get("PRICE")),
+                "preco": _preco(v.get("PRICE")),
                 "opcionais": opcionais_veiculo,
-                "fotos": self._extract_photos(v)
+                "fotos": _fotos(v)
             })
-            parsed_vehicles.append(parsed)
+            parsed_vehicles_append(parsed)
         
         return parsed_vehicles
     
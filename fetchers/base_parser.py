@@ -3,57 +3,260 @@ Base parser class - Define a interface comum para todos os parsers de veículos
 """
 
 from abc import ABC, abstractmethod
-from typing import Dict, List, Any
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Dict, List, Any, Tuple, Union
 from vehicle_mappings import (
     MAPEAMENTO_CATEGORIAS, 
     MAPEAMENTO_MOTOS, 
     OPCIONAL_CHAVE_HATCH
 )
 import re
+import sys
 from unidecode import unidecode
 
+@dataclass(slots=True)
+class RawVehicle:
+    """Dados brutos de um veículo, com os mesmos campos do formato normalizado"""
+    id: Any = None
+    tipo: Any = None
+    titulo: Any = None
+    versao: Any = None
+    marca: Any = None
+    modelo: Any = None
+    observacao: Any = None
+    ano: Any = None
+    ano_fabricacao: Any = None
+    km: Any = None
+    cor: Any = None
+    combustivel: Any = None
+    cambio: Any = None
+    motor: Any = None
+    portas: Any = None
+    categoria: Any = None
+    cilindrada: Any = None
+    preco: Any = 0.0
+    opcionais: Any = ""
+    localizacao: Any = None
+    fotos: Any = field(default_factory=list)
+
+def _normalizar_texto(texto: str) -> str:
+    """Normaliza texto para comparação"""
+    if not texto: 
+        return ""
+    texto_norm = unidecode(str(texto)).lower()
+
+    # ← ADICIONE ESTA LINHA: Converte caracteres especiais em espaços
+    texto_norm = re.sub(r'[-_./]', ' ', texto_norm)  # hífen, underscore, ponto, barra
+
+    texto_norm = re.sub(r'[^a-z0-9\s]', '', texto_norm)
+    texto_norm = re.sub(r'\s+', ' ', texto_norm).strip()
+    return texto_norm
+
+# Chaves dos mapeamentos já normalizadas (calculadas uma vez, na importação),
+# mantendo a ordem original para preservar a prioridade das correspondências
+_CATEGORIAS_NORMALIZADAS = [
+    (_normalizar_texto(modelo_mapeado), categoria)
+    for modelo_mapeado, categoria in MAPEAMENTO_CATEGORIAS.items()
+]
+_OPCIONAL_CHAVE_HATCH_NORM = _normalizar_texto(OPCIONAL_CHAVE_HATCH)
+_MOTOS_NORMALIZADAS = [
+    (modelo_norm, modelo_norm.replace(' ', ''), cilindrada, categoria)
+    for modelo_norm, (cilindrada, categoria) in (
+        (_normalizar_texto(modelo_mapeado), valor) for modelo_mapeado, valor in MAPEAMENTO_MOTOS.items()
+    )
+]
+
+@lru_cache(maxsize=4096)
+def _hatch_ou_sedan(opcionais: str) -> str:
+    """Decide entre Hatch e Sedan para modelos ambíguos a partir dos opcionais"""
+    return "Hatch" if _OPCIONAL_CHAVE_HATCH_NORM in _normalizar_texto(opcionais) else "Sedan"
+
+@lru_cache(maxsize=8192)
+def _categoria_do_modelo(modelo: str) -> str:
+    """
+    Busca a categoria do modelo no mapeamento (exata, depois parcial).
+    Modelos ambíguos retornam "hatch,sedan"; a decisão fica com os opcionais.
+    """
+    if not modelo: 
+        return None
+
+    modelo_norm = _normalizar_texto(modelo)
+
+    # Busca exata - ambos os lados normalizados (chaves pré-normalizadas)
+    for modelo_mapeado_norm, categoria_result in _CATEGORIAS_NORMALIZADAS:
+        if modelo_mapeado_norm == modelo_norm:
+            return categoria_result
+
+    # Busca parcial - para casos como "Onix LTZ" corresponder a "onix"
+    for modelo_mapeado_norm, categoria in _CATEGORIAS_NORMALIZADAS:
+        if modelo_mapeado_norm in modelo_norm:
+            return categoria
+
+    return None  # Nenhuma correspondência encontrada
+
+def _definir_categoria_veiculo(modelo: str, opcionais: str = "") -> str:
+    """
+    Define a categoria de um veículo usando busca EXATA no mapeamento.
+    Para modelos ambíguos ("hatch,sedan"), usa os opcionais para decidir.
+    """
+    categoria = _chamar_com_cache(_categoria_do_modelo, modelo)
+    if categoria == "hatch,sedan":
+        return _chamar_com_cache(_hatch_ou_sedan, opcionais)
+    return categoria
+
+@lru_cache(maxsize=8192)
+def _inferir_cilindrada_e_categoria_moto(modelo: str, versao: str = ""):
+    """
+    Infere cilindrada e categoria para motocicletas baseado no modelo e versão.
+    Busca primeiro no modelo, depois na versão se não encontrar.
+    Retorna uma tupla (cilindrada, categoria).
+    """
+    def buscar_no_texto(texto: str):
+        if not texto: 
+            return None, None
+
+        texto_norm = _normalizar_texto(texto)
+
+        # Busca exata primeiro
+        if texto_norm in MAPEAMENTO_MOTOS:
+            cilindrada, categoria = MAPEAMENTO_MOTOS[texto_norm]
+            return cilindrada, categoria
+
+        # Busca por correspondência parcial - ordena por comprimento (mais específico primeiro)
+        matches = []
+        for modelo_mapeado_norm, modelo_sem_espaco, cilindrada, categoria in _MOTOS_NORMALIZADAS:
+            # Verifica se o modelo mapeado está contido no texto
+            if modelo_mapeado_norm in texto_norm:
+                matches.append((modelo_mapeado_norm, cilindrada, categoria, len(modelo_mapeado_norm)))
+
+            # Verifica também variações sem espaço (ybr150 vs ybr 150)
+            if modelo_sem_espaco in texto_norm:
+                matches.append((modelo_sem_espaco, cilindrada, categoria, len(modelo_sem_espaco)))
+
+        # Se encontrou correspondências, retorna a mais específica (maior comprimento)
+        if matches:
+            # Ordena por comprimento decrescente para pegar a correspondência mais específica
+            matches.sort(key=lambda x: x[3], reverse=True)
+            _, cilindrada, categoria, _ = matches[0]
+            return cilindrada, categoria
+
+        return None, None
+
+    # Busca primeiro no modelo
+    cilindrada, categoria = buscar_no_texto(modelo)
+
+    # Se não encontrou e tem versão, busca na versão
+    if not cilindrada and versao:
+        cilindrada, categoria = buscar_no_texto(versao)
+
+    # TERCEIRA TENTATIVA: modelo + versao como frase completa
+    if not cilindrada and versao:
+        cilindrada, categoria = buscar_no_texto(f"{modelo} {versao}")
+
+    return cilindrada, categoria
+
+@lru_cache(maxsize=8192)
+def _converter_preco(valor: Any) -> float:
+    """Converte string de preço para float"""
+    if not valor: 
+        return 0.0
+    try:
+        if isinstance(valor, (int, float)): 
+            return float(valor)
+        valor_str = str(valor)
+        valor_str = re.sub(r'[^\d,.]', '', valor_str).replace(',', '.')
+        parts = valor_str.split('.')
+        if len(parts) > 2: 
+            valor_str = ''.join(parts[:-1]) + '.' + parts[-1]
+        return float(valor_str) if valor_str else 0.0
+    except (ValueError, TypeError): 
+        return 0.0
+
+def _chamar_com_cache(funcao, *args):
+    """Chama a versão em cache da função; argumentos não-hashable vão direto à original"""
+    try:
+        return funcao(*args)
+    except TypeError:
+        return funcao.__wrapped__(*args)
+
+# Campos com poucos valores distintos ("moto", "carro", "manual", marcas...),
+# internados para que os veículos compartilhem o mesmo objeto str
+CAMPOS_INTERNADOS = ("tipo", "marca", "cor", "combustivel", "cambio", "categoria", "localizacao")
+
+def _internar_campos(veiculo: Dict) -> Dict:
+    """Interna (sys.intern) as strings dos campos categóricos do veículo"""
+    for campo in CAMPOS_INTERNADOS:
+        valor = veiculo[campo]
+        if type(valor) is str:
+            veiculo[campo] = sys.intern(valor)
+    return veiculo
+
+def _juntar_opcionais(itens: List) -> str:
+    """Junta os itens não vazios com ", " (str() só para itens que não são string)"""
+    return ", ".join(item if isinstance(item, str) else str(item) for item in itens if item)
+
 class BaseParser(ABC):
     """Classe base abstrata para todos os parsers de veículos"""
     
+    # Trechos de URL (em minúsculas) que identificam o fornecedor
+    URL_FRAGMENTS: Tuple[str, ...] = ()
+    
     @abstractmethod
     def can_parse(self, data: Any, url: str) -> bool:
         """Verifica se este parser pode processar os dados da URL fornecida"""
         pass
     
+    def matches_url(self, url_lower: str) -> bool:
+        """Verifica se a URL (já em minúsculas) contém algum trecho do fornecedor"""
+        return any(fragment in url_lower for fragment in self.URL_FRAGMENTS)
+    
+    def can_parse_data(self, data: Any) -> bool:
+        """Verifica pela estrutura dos dados (parsers que não dependem da URL)"""
+        return False
+    
     @abstractmethod
     def parse(self, data: Any, url: str) -> List[Dict]:
         """Processa os dados e retorna lista de veículos normalizados"""
         pass
     
-    def normalize_vehicle(self, vehicle: Dict) -> Dict:
-        """Normaliza um veículo para o formato padrão"""
+    def normalize_vehicle(self, vehicle: Union[Dict, RawVehicle]) -> Dict:
+        """Normaliza um veículo (dict ou RawVehicle) para o formato padrão"""
+        if isinstance(vehicle, RawVehicle):
+            # Aplica normalização nas fotos antes de retornar
+            vehicle.fotos = self.normalize_fotos(vehicle.fotos)
+            # Os campos do RawVehicle seguem a mesma ordem do formato padrão
+            return _internar_campos({campo: getattr(vehicle, campo) for campo in RawVehicle.__slots__})
+        
         # Aplica normalização nas fotos antes de retornar
         fotos = vehicle.get("fotos", [])
         vehicle["fotos"] = self.normalize_fotos(fotos)
         
-        return {
-            "id": vehicle.get("id"), 
-            "tipo": vehicle.get("tipo"), 
-            "titulo": vehicle.get("titulo"),
-            "versao": vehicle.get("versao"), 
-            "marca": vehicle.get("marca"), 
-            "modelo": vehicle.get("modelo"),
-            "observacao": vehicle.get("observacao"),
-            "ano": vehicle.get("ano"), 
-            "ano_fabricacao": vehicle.get("ano_fabricacao"), 
-            "km": vehicle.get("km"),
-            "cor": vehicle.get("cor"), 
-            "combustivel": vehicle.get("combustivel"), 
-            "cambio": vehicle.get("cambio"),
-            "motor": vehicle.get("motor"), 
-            "portas": vehicle.get("portas"), 
-            "categoria": vehicle.get("categoria"),
-            "cilindrada": vehicle.get("cilindrada"), 
-            "preco": vehicle.get("preco", 0.0),
-            "opcionais": vehicle.get("opcionais", ""),
-            "localizacao": vehicle.get("localizacao"),
-            "fotos": vehicle.get("fotos", [])
-        }
+        # Método get ligado a uma variável local (21 buscas por veículo)
+        get = vehicle.get
+        return _internar_campos({
+            "id": get("id"), 
+            "tipo": get("tipo"), 
+            "titulo": get("titulo"),
+            "versao": get("versao"), 
+            "marca": get("marca"), 
+            "modelo": get("modelo"),
+            "observacao": get("observacao"),
+            "ano": get("ano"), 
+            "ano_fabricacao": get("ano_fabricacao"), 
+            "km": get("km"),
+            "cor": get("cor"), 
+            "combustivel": get("combustivel"), 
+            "cambio": get("cambio"),
+            "motor": get("motor"), 
+            "portas": get("portas"), 
+            "categoria": get("categoria"),
+            "cilindrada": get("cilindrada"), 
+            "preco": get("preco", 0.0),
+            "opcionais": get("opcionais", ""),
+            "localizacao": get("localizacao"),
+            "fotos": get("fotos", [])
+        })
     
     def normalize_fotos(self, fotos_data: Any) -> List[str]:
         """
@@ -71,6 +274,12 @@ class BaseParser(ABC):
         if not fotos_data:
             return []
         
+        # Caso mais comum: lista plana de strings (sem funções aninhadas nem recursão)
+        if type(fotos_data) is list:
+            urls = [item.strip() for item in fotos_data if type(item) is str]
+            if len(urls) == len(fotos_data):
+                return list(dict.fromkeys([url for url in urls if url]))
+        
         result = []
         
         def extract_url_from_item(item):
@@ -83,7 +292,7 @@ class BaseParser(ABC):
                     if key in item and item[key]:
                         url = str(item[key]).strip()
                         # Remove parâmetros de query se houver
-                        return url.split("?")[0] if "?" in url else url
+                        return url.partition("?")[0]
             return None
         
         def process_item(item):
@@ -120,115 +329,32 @@ class BaseParser(ABC):
     
     def normalizar_texto(self, texto: str) -> str:
         """Normaliza texto para comparação"""
-        if not texto: 
-            return ""
-        texto_norm = unidecode(str(texto)).lower()
-        
-        # ← ADICIONE ESTA LINHA: Converte caracteres especiais em espaços
-        texto_norm = re.sub(r'[-_./]', ' ', texto_norm)  # hífen, underscore, ponto, barra
-        
-        texto_norm = re.sub(r'[^a-z0-9\s]', '', texto_norm)
-        texto_norm = re.sub(r'\s+', ' ', texto_norm).strip()
-        return texto_norm
+        return _normalizar_texto(texto)
     
     def definir_categoria_veiculo(self, modelo: str, opcionais: str = "") -> str:
         """
         Define a categoria de um veículo usando busca EXATA no mapeamento.
         Para modelos ambíguos ("hatch,sedan"), usa os opcionais para decidir.
+        A busca no mapeamento fica em cache por modelo; os opcionais (que variam
+        a cada veículo) só são avaliados para os modelos ambíguos.
         """
-        if not modelo: 
-            return None
-        
-        modelo_norm = self.normalizar_texto(modelo)
-        
-        # Busca exata - normaliza AMBOS os lados para comparação
-        for modelo_mapeado, categoria_result in MAPEAMENTO_CATEGORIAS.items():
-            if self.normalizar_texto(modelo_mapeado) == modelo_norm:
-                if categoria_result == "hatch,sedan":
-                    opcionais_norm = self.normalizar_texto(opcionais)
-                    opcional_chave_norm = self.normalizar_texto(OPCIONAL_CHAVE_HATCH)
-                    return "Hatch" if opcional_chave_norm in opcionais_norm else "Sedan"
-                else:
-                    return categoria_result
-        
-        # Busca parcial - para casos como "Onix LTZ" corresponder a "onix"
-        for modelo_mapeado, categoria in MAPEAMENTO_CATEGORIAS.items():
-            modelo_mapeado_norm = self.normalizar_texto(modelo_mapeado)
-            if modelo_mapeado_norm in modelo_norm:
-                if categoria == "hatch,sedan":
-                    opcionais_norm = self.normalizar_texto(opcionais)
-                    opcional_chave_norm = self.normalizar_texto(OPCIONAL_CHAVE_HATCH)
-                    return "Hatch" if opcional_chave_norm in opcionais_norm else "Sedan"
-                else:
-                    return categoria
-        
-        return None  # Nenhuma correspondência encontrada
+        return _definir_categoria_veiculo(modelo, opcionais)
     
     def inferir_cilindrada_e_categoria_moto(self, modelo: str, versao: str = ""):
         """
         Infere cilindrada e categoria para motocicletas baseado no modelo e versão.
-        Busca primeiro no modelo, depois na versão se não encontrar.
-        Retorna uma tupla (cilindrada, categoria).
+        Retorna uma tupla (cilindrada, categoria), em cache por (modelo, versao).
         """
-        def buscar_no_texto(texto: str):
-            if not texto: 
-                return None, None
-            
-            texto_norm = self.normalizar_texto(texto)
-            
-            # Busca exata primeiro
-            if texto_norm in MAPEAMENTO_MOTOS:
-                cilindrada, categoria = MAPEAMENTO_MOTOS[texto_norm]
-                return cilindrada, categoria
-            
-            # Busca por correspondência parcial - ordena por comprimento (mais específico primeiro)
-            matches = []
-            for modelo_mapeado, (cilindrada, categoria) in MAPEAMENTO_MOTOS.items():
-                modelo_mapeado_norm = self.normalizar_texto(modelo_mapeado)
-                
-                # Verifica se o modelo mapeado está contido no texto
-                if modelo_mapeado_norm in texto_norm:
-                    matches.append((modelo_mapeado_norm, cilindrada, categoria, len(modelo_mapeado_norm)))
-                
-                # Verifica também variações sem espaço (ybr150 vs ybr 150)
-                modelo_sem_espaco = modelo_mapeado_norm.replace(' ', '')
-                if modelo_sem_espaco in texto_norm:
-                    matches.append((modelo_sem_espaco, cilindrada, categoria, len(modelo_sem_espaco)))
-            
-            # Se encontrou correspondências, retorna a mais específica (maior comprimento)
-            if matches:
-                # Ordena por comprimento decrescente para pegar a correspondência mais específica
-                matches.sort(key=lambda x: x[3], reverse=True)
-                _, cilindrada, categoria, _ = matches[0]
-                return cilindrada, categoria
-            
-            return None, None
-        
-        # Busca primeiro no modelo
-        cilindrada, categoria = buscar_no_texto(modelo)
-        
-        # Se não encontrou e tem versão, busca na versão
-        if not cilindrada and versao:
-            cilindrada, categoria = buscar_no_texto(versao)
-        
-        # TERCEIRA TENTATIVA: modelo + versao como frase completa
-        if not cilindrada and versao:
-            cilindrada, categoria = buscar_no_texto(f"{modelo} {versao}")
-        
-        return cilindrada, categoria
+        return _chamar_com_cache(_inferir_cilindrada_e_categoria_moto, modelo, versao)
     
     def converter_preco(self, valor: Any) -> float:
-        """Converte string de preço para float"""
-        if not valor: 
-            return 0.0
-        try:
-            if isinstance(valor, (int, float)): 
-                return float(valor)
-            valor_str = str(valor)
-            valor_str = re.sub(r'[^\d,.]', '', valor_str).replace(',', '.')
-            parts = valor_str.split('.')
-            if len(parts) > 2: 
-                valor_str = ''.join(parts[:-1]) + '.' + parts[-1]
-            return float(valor_str) if valor_str else 0.0
-        except (ValueError, TypeError): 
-            return 0.0
+        """Converte string de preço para float (resultado em cache por valor)"""
+        return _chamar_com_cache(_converter_preco, valor)
+    
+    def _parse_opcionais(self, opcionais: Any) -> str:
+        """Processa opcionais (lista, {"opcional": ...} ou valor único) para string"""
+        if isinstance(opcionais, dict) and "opcional" in opcionais:
+            opcionais = opcionais["opcional"]
+        if isinstance(opcionais, list):
+            return _juntar_opcionais(opcionais)
+        return str(opcionais) if opcionais else ""
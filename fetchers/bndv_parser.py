@@ -11,17 +11,16 @@ import re
 class BndvParser(BaseParser):
     """Parser para dados do BNDV"""
     
+    URL_FRAGMENTS = ("bndv", "sistema.lojistas")
+    
     def can_parse(self, data: Any, url: str) -> bool:
         """Verifica se pode processar dados do BNDV"""
         # Verifica se é BNDV pela URL ou estrutura dos dados
-        if "bndv" in url.lower() or "sistema.lojistas" in url.lower():
-            return True
-        
-        # Verifica pela estrutura do JSON
-        if isinstance(data, dict) and "vehiclesBy" in data:
-            return True
-        
-        return False
+        return self.matches_url(url.lower()) or self.can_parse_data(data)
+    
+    def can_parse_data(self, data: Any) -> bool:
+        """Verifica pela estrutura do JSON"""
+        return isinstance(data, dict) and "vehiclesBy" in data
     
     def parse(self, data: Any, url: str) -> List[Dict]:
         """Processa dados do BNDV"""
@@ -30,7 +29,14 @@ class BndvParser(BaseParser):
         if not isinstance(veiculos, list):
             veiculos = [veiculos]
         
+        # Métodos usados no laço ligados a variáveis locais
+        _norm = self.normalize_vehicle
+        _cat = self.definir_categoria_veiculo
+        _opcionais = self._parse_opcionais
+        _motor = self._extract_motor_from_version
+        _fotos = self._parse_fotos
         parsed_vehicles = []
+        parsed_vehicles_append = parsed_vehicles.append
         for v in veiculos:
             # Extrai dados básicos
             marca = v.get("markName")
@@ -38,16 +44,16 @@ class BndvParser(BaseParser):
             versao = v.get("versionName")
             
             # Processa opcionais
-            opcionais_veiculo = self._parse_opcionais(v.get("itemJs"))
+            opcionais_veiculo = _opcionais(v.get("itemJs"))
             
             # Determina categoria
-            categoria_final = self.definir_categoria_veiculo(modelo, opcionais_veiculo)
+            categoria_final = _cat(modelo, opcionais_veiculo)
             
             # Usa a placa ao contrário como ID
             placa = v.get("plate")
             vehicle_id = placa[::-1] if placa else None
             
-            parsed = self.normalize_vehicle({
+            parsed = _norm({
                 "id": vehicle_id,
                 "tipo": "carro",
                 "titulo": None,
@@ -60,15 +66,15 @@ class BndvParser(BaseParser):
                 "cor": v.get("color"),
                 "combustivel": v.get("fuelName"),
                 "cambio": v.get("transmissionName"),
-                "motor": self._extract_motor_from_version(versao),
+                "motor": _motor(versao),
                 "portas": None,
                 "categoria": categoria_final,
                 "cilindrada": None,
                 "preco": v.get("saleValue"),
                 "opcionais": opcionais_veiculo,
-                "fotos": self._parse_fotos(v.get("pictureJs"))
+                "fotos": _fotos(v.get("pictureJs"))
             })
-            parsed_vehicles.append(parsed)
+            parsed_vehicles_append(parsed)
         
         return parsed_vehicles
     
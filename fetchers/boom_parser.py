@@ -8,9 +8,11 @@ from typing import Dict, List, Any, Union
 class BoomParser(BaseParser):
     """Parser genérico para estruturas variadas - usado como fallback"""
     
+    URL_FRAGMENTS = ("boomsistemas.com.br",)
+    
     def can_parse(self, data: Any, url: str) -> bool:
         """Aceita dados de boomsistemas.com.br ou como fallback genérico"""
-        return "boomsistemas.com.br" in url.lower()
+        return self.matches_url(url.lower())
     
     def parse(self, data: Any, url: str) -> List[Dict]:
         """Processa dados com estrutura genérica/variável"""
@@ -27,7 +29,13 @@ class BoomParser(BaseParser):
                 elif isinstance(veiculo_data, dict):
                     veiculos = [veiculo_data]
         
+        # Métodos usados no laço ligados a variáveis locais
+        _norm = self.normalize_vehicle
+        _preco = self.converter_preco
+        _cat = self.definir_categoria_veiculo
+        _moto = self.inferir_cilindrada_e_categoria_moto
         parsed_vehicles = []
+        parsed_vehicles_append = parsed_vehicles.append
         for v in veiculos:
             if not isinstance(v, dict):
                 continue
@@ -39,12 +47,12 @@ class BoomParser(BaseParser):
             is_moto = 'moto' in str(tipo_veiculo).lower()
             
             if is_moto:
-                cilindrada_final, categoria_final = self.inferir_cilindrada_e_categoria_moto(
+                cilindrada_final, categoria_final = _moto(
                     modelo_veiculo, None
                 )
                 tipo_final = "moto"
             else:
-                categoria_final = self.definir_categoria_veiculo(modelo_veiculo, "")
+                categoria_final = _cat(modelo_veiculo, "")
                 cilindrada_final = None
                 tipo_final = tipo_veiculo
             
@@ -68,7 +76,7 @@ class BoomParser(BaseParser):
                 elif items:
                     opcionais_str = str(items)
             
-            parsed = self.normalize_vehicle({
+            parsed = _norm({
                 "id": v.get('id'),
                 "tipo": tipo_final,
                 "titulo": v.get('titulo'),
@@ -85,10 +93,10 @@ class BoomParser(BaseParser):
                 "portas": v.get('portas'),
                 "categoria": categoria_final,
                 "cilindrada": cilindrada_final,
-                "preco": self.converter_preco(v.get('valor')),
+                "preco": _preco(v.get('valor')),
                 "opcionais": opcionais_str,
                 "fotos": fotos
             })
-            parsed_vehicles.append(parsed)
+            parsed_vehicles_append(parsed)
         
         return parsed_vehicles
@@ -2,23 +2,102 @@
 Parser específico para Carburgo (citroenpremiere.com.br)
 """
 
-from .base_parser import BaseParser
-from typing import Dict, List, Any
+from .base_parser import BaseParser, RawVehicle
+from typing import Dict, List, Any, Union
 import re
-import xml.etree.ElementTree as ET
+
+try:
+    # lxml (libxml2) quando disponível; mesma API do ElementTree da stdlib
+    from lxml import etree as ET
+except ImportError:
+    import xml.etree.ElementTree as ET
+
+# Tamanho (em caracteres) de cada trecho entregue ao parser XML incremental
+XML_CHUNK_SIZE = 64 * 1024
+
+class _CarrosTarget:
+    """
+    Alvo do parser XML que monta o dict de cada <carro> filho direto da raiz.
+    
+    Cada campo recebe o texto anterior ao seu primeiro filho (como Element.text)
+    e <fotos> vira {"foto": [urls]}; comentários e instruções são ignorados.
+    """
+    
+    def __init__(self):
+        self.carros = []
+        self._profundidade = 0
+        self._carro = None   # dict do <carro> em andamento
+        self._fotos = None   # lista de URLs quando o campo atual é <fotos>
+        self._partes = None  # trechos de texto do elemento sendo lido
+        self._texto = None   # texto já encerrado pelo primeiro filho do elemento
+    
+    def start(self, tag, attrib):
+        self._profundidade += 1
+        profundidade = self._profundidade
+        if self._carro is None:
+            if profundidade == 2 and tag == 'carro':
+                self._carro = {}
+            return
+        if self._partes is not None:
+            # O texto do elemento pai termina no primeiro filho
+            self._texto = ''.join(self._partes) or None
+            self._partes = None
+        if profundidade == 3:
+            self._texto = None
+            self._partes = []
+            self._fotos = [] if tag == 'fotos' else None
+        elif profundidade == 4 and self._fotos is not None and tag == 'foto':
+            self._texto = None
+            self._partes = []
+    
+    def data(self, texto):
+        if self._partes is not None:
+            self._partes.append(texto)
+    
+    def end(self, tag):
+        profundidade = self._profundidade
+        self._profundidade -= 1
+        carro = self._carro
+        if carro is None:
+            return
+        if profundidade == 2:
+            self.carros.append(carro)
+            self._carro = None
+            return
+        if profundidade > 4:
+            return
+        if profundidade == 3 or (self._fotos is not None and tag == 'foto'):
+            partes = self._partes
+            texto = (''.join(partes) or None) if partes is not None else self._texto
+            self._partes = None
+            if profundidade == 4:
+                if texto:
+                    self._fotos.append(texto)
+            elif self._fotos is not None:
+                carro[tag] = {'foto': self._fotos}
+                self._fotos = None
+            else:
+                carro[tag] = texto
+    
+    def close(self):
+        return self.carros
 
 class CarburgoParser(BaseParser):
     """Parser para dados do Carburgo"""
     
+    URL_FRAGMENTS = ("citroenpremiere.com.br",)
+    
     def can_parse(self, data: Any, url: str) -> bool:
         """Verifica se pode processar dados do Carburgo"""
+        # Proteção contra url None ou vazia
         if not url:
             return False
-        return "citroenpremiere.com.br" in url.lower()
+        
+        return self.matches_url(url.lower())
     
     def parse(self, data: Any, url: str) -> List[Dict]:
         """Processa dados do Carburgo"""
-        if isinstance(data, str):
+        if isinstance(data, (str, bytes, bytearray)):
             data = self._xml_to_dict(data)
             if not data:
                 return []
@@ -39,7 +118,15 @@ class CarburgoParser(BaseParser):
         if isinstance(veiculos, dict):
             veiculos = [veiculos]
 
+        # Métodos usados no laço ligados a variáveis locais
+        _norm = self.normalize_vehicle
+        _preco = self.converter_preco
+        _cat = self.definir_categoria_veiculo
+        _moto = self.inferir_cilindrada_e_categoria_moto
+        _motor = self._extract_motor_from_version
+        _fotos = self._extract_photos
         parsed_vehicles = []
+        parsed_vehicles_append = parsed_vehicles.append
         for v in veiculos:
             modelo_veiculo = (v.get("modelo") or "").strip()
             versao_veiculo = (v.get("modelo") or "").strip()  # Use modelo as versao
@@ -47,66 +134,59 @@ class CarburgoParser(BaseParser):
 
             # Determina se é moto ou carro
             tipo_veiculo = (v.get("tipo") or "").lower()
-            is_moto = "moto" in tipo_veiculo or "motocicleta" in tipo_veiculo
+            is_moto = "moto" in tipo_veiculo
 
             if is_moto:
-                cilindrada_final, categoria_final = self.inferir_cilindrada_e_categoria_moto(
+                cilindrada_final, categoria_final = _moto(
                     modelo_veiculo, versao_veiculo
                 )
             else:
                 # Usa o tipo do XML se existir, senão infere pela categoria usando BaseParser
-                categoria_final = v.get("tipo") or self.definir_categoria_veiculo(modelo_veiculo, opcionais_veiculo or "")
+                categoria_final = v.get("tipo") or _cat(modelo_veiculo, opcionais_veiculo or "")
                 cilindrada_final = v.get("cilindradas")
 
             placa = v.get("placa", "")
             id_str = "".join(d for i, d in enumerate(placa) if i in [1, 2, 3, 5, 6]) if placa else None
 
-            parsed = self.normalize_vehicle({
-                "id": id_str,
-                "tipo": "moto" if is_moto else "carro",
-                "titulo": None,
-                "versao": versao_veiculo or None,
-                "marca": v.get("marca") or None,
-                "modelo": modelo_veiculo or None,
-                "ano": v.get("ano_modelo"),
-                "ano_fabricacao": v.get("ano"),
-                "km": v.get("km"),
-                "cor": None,
-                "combustivel": v.get("combustivel"),
-                "cambio": v.get("cambio"),
-                "motor": self._extract_motor_from_version(versao_veiculo),
-                "portas": v.get("portas"),
-                "categoria": categoria_final,
-                "cilindrada": cilindrada_final,
-                "preco": self.converter_preco(v.get("preco")),
-                "opcionais": opcionais_veiculo,
-                "fotos": self._extract_photos(v),
-                "url": v.get("url"),
-                "localizacao": v.get("unidade"),
-                "descricao": v.get("descricao")
-            })
-            parsed_vehicles.append(parsed)
+            parsed = _norm(RawVehicle(
+                id=id_str,
+                tipo="moto" if is_moto else "carro",
+                titulo=None,
+                versao=versao_veiculo or None,
+                marca=v.get("marca") or None,
+                modelo=modelo_veiculo or None,
+                ano=v.get("ano_modelo"),
+                ano_fabricacao=v.get("ano"),
+                km=v.get("km"),
+                cor=None,
+                combustivel=v.get("combustivel"),
+                cambio=v.get("cambio"),
+                motor=_motor(versao_veiculo),
+                portas=v.get("portas"),
+                categoria=categoria_final,
+                cilindrada=cilindrada_final,
+                preco=_preco(v.get("preco")),
+                opcionais=opcionais_veiculo,
+                localizacao=v.get("unidade"),
+                fotos=_fotos(v)
+            ))
+            parsed_vehicles_append(parsed)
 
         return parsed_vehicles
 
-    def _xml_to_dict(self, xml_str: str) -> Dict:
-        """Converte XML para dict similar ao Autocerto"""
+    def _xml_to_dict(self, xml_str: Union[str, bytes, bytearray]) -> Dict:
+        """Converte XML (texto ou bytes) para dict similar ao Autocerto"""
         try:
-            root = ET.fromstring(xml_str)
-            carros = []
-            
-            for carro in root.findall('carro'):
-                carro_dict = {}
-                for child in carro:
-                    if child.tag == 'fotos':
-                        fotos = []
-                        for foto in child.findall('foto'):
-                            if foto.text:
-                                fotos.append(foto.text)
-                        carro_dict['fotos'] = {'foto': fotos}
-                    else:
-                        carro_dict[child.tag] = child.text
-                carros.append(carro_dict)
+            # Bytes vão direto ao parser, que respeita a codificação declarada
+            # no próprio XML, sem decodificar o documento inteiro antes
+            if isinstance(xml_str, bytearray):
+                xml_str = bytes(xml_str)
+            # Leitura incremental com alvo próprio: cada <carro> vira dict direto
+            # dos eventos do parser, sem criar elementos nem manter a árvore
+            parser = ET.XMLParser(target=_CarrosTarget())
+            for inicio in range(0, len(xml_str), XML_CHUNK_SIZE):
+                parser.feed(xml_str[inicio:inicio + XML_CHUNK_SIZE])
+            carros = parser.close()
             
             if not carros:
                 print(f"[AVISO] Nenhum elemento <carro> encontrado no XML")
@@ -119,15 +199,6 @@ class CarburgoParser(BaseParser):
             traceback.print_exc()
             return {}
     
-    def _parse_opcionais(self, opcionais: Any) -> str:
-        """Processa os opcionais do Carburgo"""
-        if isinstance(opcionais, dict) and "opcional" in opcionais:
-            opcional = opcionais["opcional"]
-            if isinstance(opcional, list):
-                return ", ".join(str(item) for item in opcional if item)
-            return str(opcional) if opcional else ""
-        return ""
-    
     def _clean_version(self, modelo: str, versao: str) -> str:
         """Limpa a versão removendo informações técnicas redundantes"""
         if not versao:
@@ -149,7 +220,7 @@ class CarburgoParser(BaseParser):
         if not versao:
             return None
         
-        words = versao.strip().split()
+        words = versao.split(None, 1)
         return words[0] if words else None
     
     def _extract_photos(self, v: Dict) -> List[str]:
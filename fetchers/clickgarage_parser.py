@@ -9,9 +9,11 @@ import re
 class ClickGarageParser(BaseParser):
     """Parser para dados do ClickGarage"""
     
+    URL_FRAGMENTS = ("clickgarage.com.br",)
+    
     def can_parse(self, data: Any, url: str) -> bool:
         """Verifica se pode processar dados do ClickGarage"""
-        return "clickgarage.com.br" in url.lower()
+        return self.matches_url(url.lower())
     
     def parse(self, data: Any, url: str) -> List[Dict]:
         """Processa dados do ClickGarage"""
@@ -22,7 +24,19 @@ class ClickGarageParser(BaseParser):
         if isinstance(veiculos, dict):
             veiculos = [veiculos]
         
+        # Métodos usados no laço ligados a variáveis locais
+        _norm = self.normalize_vehicle
+        _preco = self.converter_preco
+        _cat = self.definir_categoria_veiculo
+        _moto = self.inferir_cilindrada_e_categoria_moto
+        _versao = self._clean_version
+        _cambio = self._extract_cambio_info
+        _marca_modelo = self._extract_marca_modelo
+        _motor_info = self._extract_motor_info
+        _fotos = self._extract_photos_clickgarage
+        _opcionais = self._parse_opcionais_clickgarage
         parsed_vehicles = []
+        parsed_vehicles_append = parsed_vehicles.append
         
         for v in veiculos:
             if not isinstance(v, dict):
@@ -33,33 +47,33 @@ class ClickGarageParser(BaseParser):
             modelo_completo = v.get("modelo", "")
             
             # Separa marca do modelo
-            marca_final, modelo_final = self._extract_marca_modelo(marca_modelo, modelo_completo)
+            marca_final, modelo_final = _marca_modelo(marca_modelo, modelo_completo)
             
             # Processa opcionais
-            opcionais_processados = self._parse_opcionais_clickgarage(v.get("opcionais", {}))
+            opcionais_processados = _opcionais(v.get("opcionais", {}))
             
             # Determina se é moto ou carro
             tipo_veiculo = v.get("tipo", "").lower()
-            is_moto = "moto" in tipo_veiculo or "motocicleta" in tipo_veiculo
+            is_moto = "moto" in tipo_veiculo
             
             if is_moto:
                 # Para motos: usa o sistema com modelo E versão
-                cilindrada_final, categoria_final = self.inferir_cilindrada_e_categoria_moto(modelo_final, "")
+                cilindrada_final, categoria_final = _moto(modelo_final, "")
                 tipo_final = "moto"
             else:
                 # Para carros: usa o sistema existente
-                categoria_final = self.definir_categoria_veiculo(modelo_final, opcionais_processados)
+                categoria_final = _cat(modelo_final, opcionais_processados)
                 cilindrada_final = None
                 tipo_final = "carro"
             
             # Extrai informações do motor da versão/modelo
-            motor_info = self._extract_motor_info(modelo_completo)
+            motor_info = _motor_info(modelo_completo)
             
-            parsed = self.normalize_vehicle({
+            parsed = _norm({
                 "id": v.get("placa")[::-1] if v.get("placa") else v.get("id"),
                 "tipo": tipo_final,
                 "titulo": v.get("titulo"),
-                "versao": self._clean_version(modelo_completo),
+                "versao": _versao(modelo_completo),
                 "marca": marca_final,
                 "modelo": modelo_final,
                 "ano": v.get("anomod") or v.get("ano"),
@@ -67,17 +81,17 @@ class ClickGarageParser(BaseParser):
                 "km": v.get("km"),
                 "cor": v.get("cor"),
                 "combustivel": v.get("combustivel"),
-                "cambio": self._extract_cambio_info(modelo_completo),
+                "cambio": _cambio(modelo_completo),
                 "motor": motor_info,
                 "portas": None,  # ClickGarage não fornece esse campo explicitamente
                 "categoria": categoria_final,
                 "cilindrada": cilindrada_final,
-                "preco": self.converter_preco(v.get("preco")),
+                "preco": _preco(v.get("preco")),
                 "opcionais": opcionais_processados,
-                "fotos": self._extract_photos_clickgarage(v)
+                "fotos": _fotos(v)
             })
             
-            parsed_vehicles.append(parsed)
+            parsed_vehicles_append(parsed)
         
         return parsed_vehicles
     
@@ -96,7 +110,7 @@ class ClickGarageParser(BaseParser):
         
         # Extrai o modelo base (primeira palavra geralmente)
         if modelo_completo:
-            modelo_words = modelo_completo.strip().split()
+            modelo_words = modelo_completo.split(None, 1)
             modelo_final = modelo_words[0] if modelo_words else modelo_completo
         else:
             modelo_final = ""
@@ -1,37 +1,70 @@
 from .base_parser import BaseParser
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Tuple
 import re
 import os
 
 # Mapeamento de URLs para localizações baseado nas variáveis de ambiente
+# (chaves em minúsculas; a consulta é sempre feita com url.lower())
 URL_LOCALIZACAO_MAP = {
-    os.getenv("XML_URL_1", ""): "montenegro",
-    os.getenv("XML_URL_2", ""): "santa luzia",
-    os.getenv("XML_URL_3", ""): "motomecânica"
+    (os.getenv("XML_URL_1") or "").lower(): "montenegro",
+    (os.getenv("XML_URL_2") or "").lower(): "santa luzia",
+    (os.getenv("XML_URL_3") or "").lower(): "motomecânica"
 }
 
+# Padrões de regex compilados uma única vez (usados por veículo)
+_MOTOR_RE = re.compile(r'\b(\d+\.\d+)\b')
+# Termos técnicos removidos da versão do MotorLeads; o grupo "motor" captura a cilindrada
+_VERSION_RE = re.compile(r'\b(?:(?P<motor>\d+\.\d+)|16V|TB|Flex|Aut\.|Manual|4p|2p)\b', re.IGNORECASE)
+
+# Mapeamento de segment do MotorLeads (em minúsculas) para nossas categorias
+_SEGMENT_MAP = {
+    "sedan": "Sedan",
+    "hatch": "Hatch",
+    "hatchback": "Hatch",
+    "suv": "SUV",
+    "pickup": "Caminhonete",
+    "picape": "Caminhonete",
+    "van": "Minivan",
+    "minivan": "Minivan",
+    "conversivel": "Conversível",
+    "coupe": "Conversível",
+    "cupê": "Conversível"
+}
+
+# Posições da placa/referência usadas para montar o ID do veículo
+_ID_INDICES = (1, 2, 3, 5, 6)
+
+def _extract_id(texto: str) -> str:
+    """Monta o ID com os caracteres das posições 1, 2, 3, 5 e 6 do texto"""
+    if len(texto) >= 7:
+        return texto[1:4] + texto[5:7]
+    return ''.join(texto[i] for i in _ID_INDICES if i < len(texto))
+
 class ComautoParser1(BaseParser):
     """Parser para dados do AGSistema"""
     
+    URL_FRAGMENTS = ("s3.agsistema.net",)
+    
     def can_parse(self, data: Any, url: str) -> bool:
         """Verifica se pode processar dados do AGSistema"""
         # Proteção contra url None ou vazia
         if not url:
             return False
         
-        url = url.lower()
-        return "s3.agsistema.net" in url
+        return self.matches_url(url.lower())
     
     def _get_localizacao(self, url: str) -> str:
         """Determina a localização baseado na URL"""
         if not url:
             return ""
         
+        url_lower = url.lower()
+        
         # Busca exata no mapeamento
-        localizacao = URL_LOCALIZACAO_MAP.get(url, "")
+        localizacao = URL_LOCALIZACAO_MAP.get(url_lower, "")
         
         # Se não encontrou no mapeamento exato, verifica se é AGSistema (fallback)
-        if not localizacao and "s3.agsistema.net" in url.lower():
+        if not localizacao and self.matches_url(url_lower):
             return "montenegro"
         
         return localizacao
@@ -44,32 +77,42 @@ class ComautoParser1(BaseParser):
         # Define a localização baseada na URL
         localizacao = self._get_localizacao(url)
         
-        parsed_vehicles = []
-        for v in veiculos:
+        # Métodos usados no laço ligados a variáveis locais
+        _norm = self.normalize_vehicle
+        _preco = self.converter_preco
+        _cat = self.definir_categoria_veiculo
+        _moto = self.inferir_cilindrada_e_categoria_moto
+        _opcionais = self._parse_opcionais
+        
+        # Lista pré-alocada: cada veículo ocupa sua posição (sem realocações do append)
+        parsed_vehicles = [None] * len(veiculos)
+        for idx, v in enumerate(veiculos):
             modelo_veiculo = v.get("modelo")
             versao_veiculo = v.get("versao")
-            opcionais_veiculo = self._parse_opcionais(v.get("opcionais"))
+            opcionais_veiculo = _opcionais(v.get("opcionais"))
             
             # Determina se é moto ou carro
-            tipo_veiculo = v.get("tipo", "").lower()
-            is_moto = "moto" in tipo_veiculo or "motocicleta" in tipo_veiculo
+            tipo_veiculo = (v.get("tipo") or "").lower()
+            is_moto = "moto" in tipo_veiculo
             
             if is_moto:
                 # Para motos: usa o sistema com modelo E versão
-                cilindrada_final, categoria_final = self.inferir_cilindrada_e_categoria_moto(
-                    modelo_veiculo, versao_veiculo
-                )
+                cilindrada_final, categoria_final = _moto(modelo_veiculo, versao_veiculo)
             else:
                 # Para carros: usa o sistema existente
-                categoria_final = self.definir_categoria_veiculo(modelo_veiculo, opcionais_veiculo)
+                categoria_final = _cat(modelo_veiculo, opcionais_veiculo)
                 cilindrada_final = None
             
             # Processa preço
             preco_data = v.get("preco", {})
             if isinstance(preco_data, dict):
-                preco_final = self.converter_preco(preco_data.get("venda"))
+                preco_final = _preco(preco_data.get("venda"))
             else:
-                preco_final = self.converter_preco(preco_data)
+                preco_final = _preco(preco_data)
+            
+            # Tipo: "Carros" vira "carro"; demais categorias seguem como vieram
+            categoria_v = v.get("categoria")
+            tipo_final = "moto" if is_moto else ("carro" if categoria_v == "Carros" else categoria_v)
             
             # Normaliza câmbio
             cambio_raw = str(v.get("cambio", "")).lower()
@@ -81,12 +124,12 @@ class ComautoParser1(BaseParser):
                 cambio_final = v.get("cambio")
             
             # Extrai motor da versão
-            motor_match = re.search(r'\b(\d+\.\d+)\b', str(versao_veiculo or ""))
+            motor_match = _MOTOR_RE.search(str(versao_veiculo or ""))
             motor_final = motor_match.group(1) if motor_match else None
             
-            parsed = self.normalize_vehicle({
-                "id": ''.join(d for i, d in enumerate(str(v.get("placa", ""))) if i in [1, 2, 3, 5, 6]),
-                "tipo": "moto" if is_moto else ("carro" if v.get("categoria") == "Carros" else v.get("categoria")), 
+            parsed = _norm({
+                "id": _extract_id(str(v.get("placa", ""))),
+                "tipo": tipo_final, 
                 "titulo": None, 
                 "versao": versao_veiculo,
                 "marca": v.get("marca"), 
@@ -106,27 +149,22 @@ class ComautoParser1(BaseParser):
                 "localizacao": localizacao,
                 "fotos": v.get("fotos", [])
             })
-            parsed_vehicles.append(parsed)
+            parsed_vehicles[idx] = parsed
         return parsed_vehicles
-    
-    def _parse_opcionais(self, opcionais: Any) -> str:
-        """Processa opcionais para formato string"""
-        if isinstance(opcionais, list): 
-            return ", ".join(str(item) for item in opcionais if item)
-        return str(opcionais) if opcionais else ""
 
 
 class ComautoParser2(BaseParser):
     """Parser para dados do MotorLeads"""
     
+    URL_FRAGMENTS = ("api.motorleads.co",)
+    
     def can_parse(self, data: Any, url: str) -> bool:
         """Verifica se pode processar dados do MotorLeads"""
         # Proteção contra url None ou vazia
         if not url:
             return False
         
-        url = url.lower()
-        return "api.motorleads.co" in url
+        return self.matches_url(url.lower())
     
     def _get_localizacao(self, url: str) -> str:
         """Determina a localização baseado na URL"""
@@ -134,7 +172,7 @@ class ComautoParser2(BaseParser):
             return ""
         
         # Busca exata no mapeamento
-        return URL_LOCALIZACAO_MAP.get(url, "")
+        return URL_LOCALIZACAO_MAP.get(url.lower(), "")
     
     def parse(self, data: Any, url: str) -> List[Dict]:
         """Processa dados do MotorLeads"""
@@ -147,7 +185,19 @@ class ComautoParser2(BaseParser):
         # Define a localização baseada na URL
         localizacao = self._get_localizacao(url)
         
-        parsed_vehicles = []
+        # Métodos usados no laço ligados a variáveis locais
+        _norm = self.normalize_vehicle
+        _preco = self.converter_preco
+        _cat = self.definir_categoria_veiculo
+        _moto = self.inferir_cilindrada_e_categoria_moto
+        _attrs = self._parse_attr_list
+        _segment = self._map_segment_to_category
+        _fotos = self._extract_photos_motorleads
+        _versao = self._parse_version
+        
+        # Lista pré-alocada; itens inválidos são pulados e a sobra é cortada ao final
+        parsed_vehicles = [None] * len(results)
+        total = 0
         
         for v in results:
             if not isinstance(v, dict):
@@ -155,38 +205,35 @@ class ComautoParser2(BaseParser):
             
             # Extrai modelo base (primeira palavra do brand_model)
             brand_model = v.get("brand_model", "")
-            modelo_final = brand_model.split()[0] if brand_model else ""
+            modelo_final = brand_model.split(None, 1)[0] if brand_model else ""
             
             # Versão completa
             versao_veiculo = v.get("brand_model_version", "")
             
             # Processa opcionais
-            opcionais_processados = self._parse_attr_list(v.get("attr_list", ""))
+            opcionais_processados = _attrs(v.get("attr_list", ""))
             
             # Determina se é moto ou carro
-            category = v.get("category", "").upper()
-            segment = v.get("segment", "").upper()
-            is_moto = category == "MOTO" or category == "MOTOCICLETA"
+            category = (v.get("category") or "").upper()
+            segment = (v.get("segment") or "").upper()
+            is_moto = category.startswith("MOTO")  # MOTO, MOTOCICLETA
             
             if is_moto:
-                cilindrada_final, categoria_final = self.inferir_cilindrada_e_categoria_moto(
-                    modelo_final, versao_veiculo
-                )
+                cilindrada_final, categoria_final = _moto(modelo_final, versao_veiculo)
                 tipo_final = "moto"
             else:
                 # Tenta mapear segment primeiro, depois fallback para definir_categoria_veiculo
-                categoria_final = self._map_segment_to_category(segment)
+                categoria_final = _segment(segment)
                 if not categoria_final:
-                    categoria_final = self.definir_categoria_veiculo(modelo_final, opcionais_processados)
+                    categoria_final = _cat(modelo_final, opcionais_processados)
                 cilindrada_final = None
                 tipo_final = "carro"
             
-            # Extrai motor da versão
-            motor_info = self._extract_motor_info(versao_veiculo)
+            # Extrai motor e limpa a versão numa única passada
+            motor_info, versao_limpa = _versao(versao_veiculo)
             
             # Processa câmbio
-            transmission = v.get("transmission", "").lower()
-            cambio_final = None
+            transmission = (v.get("transmission") or "").lower()
             if "automático" in transmission or "automatico" in transmission:
                 cambio_final = "automatico"
             elif "manual" in transmission:
@@ -195,16 +242,16 @@ class ComautoParser2(BaseParser):
                 cambio_final = transmission if transmission else None
             
             # Processa fotos da galeria
-            fotos_list = self._extract_photos_motorleads(v.get("gallery", []))
+            fotos_list = _fotos(v.get("gallery", []))
             
             # Ano (year_model tem prioridade sobre year_build)
             ano_final = v.get("year_model") or v.get("year_build")
             
-            parsed = self.normalize_vehicle({
-                "id": ''.join(d for i, d in enumerate(str(v.get("reference", ""))) if i in [1, 2, 3, 5, 6]),
+            parsed = _norm({
+                "id": _extract_id(str(v.get("reference", ""))),
                 "tipo": tipo_final,
                 "titulo": v.get("title"),
-                "versao": self._clean_version(versao_veiculo),
+                "versao": versao_limpa,
                 "marca": v.get("brand"),
                 "modelo": modelo_final,
                 "ano": ano_final,
@@ -217,14 +264,16 @@ class ComautoParser2(BaseParser):
                 "portas": v.get("door"),
                 "categoria": categoria_final or segment,
                 "cilindrada": cilindrada_final,
-                "preco": self.converter_preco(v.get("price")),
+                "preco": _preco(v.get("price")),
                 "opcionais": opcionais_processados,
                 "localizacao": localizacao,
                 "fotos": fotos_list
             })
             
-            parsed_vehicles.append(parsed)
+            parsed_vehicles[total] = parsed
+            total += 1
         
+        del parsed_vehicles[total:]
         return parsed_vehicles
     
     def _parse_attr_list(self, attr_list: str) -> str:
@@ -238,57 +287,32 @@ class ComautoParser2(BaseParser):
             attrs = [attr.strip() for attr in attr_list.split(',') if attr.strip()]
             return ", ".join(attrs)
         elif isinstance(attr_list, list):
-            return ", ".join(str(item) for item in attr_list if item)
+            return self._parse_opcionais(attr_list)
         
         return str(attr_list) if attr_list else ""
     
     def _map_segment_to_category(self, segment: str) -> Optional[str]:
         """Mapeia segment do MotorLeads para nossas categorias"""
-        if not segment:
-            return None
-        
-        segment_lower = segment.lower()
-        
-        mapping = {
-            "sedan": "Sedan",
-            "hatch": "Hatch",
-            "hatchback": "Hatch",
-            "suv": "SUV",
-            "pickup": "Caminhonete",
-            "picape": "Caminhonete",
-            "van": "Minivan",
-            "minivan": "Minivan",
-            "conversivel": "Conversível",
-            "coupe": "Conversível",
-            "cupê": "Conversível"
-        }
-        
-        return mapping.get(segment_lower, None)
+        return _SEGMENT_MAP.get(segment.lower()) if segment else None
     
-    def _clean_version(self, versao: str) -> Optional[str]:
-        """Limpa a versão removendo informações técnicas redundantes"""
+    def _parse_version(self, versao: str) -> Tuple[Optional[str], Optional[str]]:
+        """Extrai o motor e limpa a versão numa única varredura: (motor, versao_limpa)"""
         if not versao:
-            return None
-        
-        # Remove padrões técnicos comuns
-        versao_limpa = re.sub(
-            r'\b(\d+\.\d+|16V|TB|Flex|Aut\.|Manual|4p|2p)\b', 
-            '', 
-            versao, 
-            flags=re.IGNORECASE
-        )
-        versao_limpa = re.sub(r'\s+', ' ', versao_limpa).strip()
+            return None, None
         
-        return versao_limpa if versao_limpa else None
-    
-    def _extract_motor_info(self, versao: str) -> Optional[str]:
-        """Extrai informações do motor da versão"""
-        if not versao:
-            return None
+        motor = None
+        partes = []
+        inicio = 0
+        for match in _VERSION_RE.finditer(versao):
+            if motor is None:
+                motor = match.group("motor")
+            partes.append(versao[inicio:match.start()])
+            inicio = match.end()
+        partes.append(versao[inicio:])
         
-        # Busca padrão de cilindrada (ex: 1.4, 2.0, 1.6)
-        motor_match = re.search(r'\b(\d+\.\d+)\b', versao)
-        return motor_match.group(1) if motor_match else None
+        # str.split() sem argumentos já colapsa espaços (sem segundo regex)
+        versao_limpa = ' '.join(''.join(partes).split())
+        return motor, versao_limpa or None
     
     def _extract_photos_motorleads(self, gallery: List) -> List[str]:
         """Extrai fotos da galeria do MotorLeads"""
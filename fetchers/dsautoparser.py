@@ -6,12 +6,23 @@ from .base_parser import BaseParser
 from typing import Dict, List, Any
 import re
 
+# Padrão de limpeza da versão, compilado uma única vez
+_DS_CLEAN_RE = re.compile(r'\b(\d\.\d|4x[0-4]|\d+v|diesel|flex|gasolina|manual|automático|4p)\b', re.IGNORECASE)
+
+# Registro base de cada veículo: copiar um dict já dimensionado sai mais barato que montar o literal
+_RECORD_TEMPLATE = dict.fromkeys((
+    "id", "tipo", "titulo", "versao", "marca", "modelo", "ano", "ano_fabricacao", "km", "cor",
+    "combustivel", "cambio", "motor", "portas", "categoria", "cilindrada", "preco", "opcionais", "fotos"
+))
+
 class DSAutoEstoqueParser(BaseParser):
     """Parser para dados do DSAutoEstoque"""
     
+    URL_FRAGMENTS = ("dsautoestoque.com",)
+    
     def can_parse(self, data: Any, url: str) -> bool:
         """Verifica se pode processar dados do DSAutoEstoque"""
-        return "dsautoestoque.com" in url.lower()
+        return self.matches_url(url.lower())
     
     def parse(self, data: Any, url: str) -> List[Dict]:
         """Processa dados do DSAutoEstoque"""
@@ -19,52 +30,60 @@ class DSAutoEstoqueParser(BaseParser):
         if isinstance(veiculos, dict):
             veiculos = [veiculos]
         
-        parsed_vehicles = []
-        for v in veiculos:
-            modelo_veiculo = self._extract_text(v.get("modelo"))
-            versao_veiculo = self._extract_text(v.get("versao"))
-            opcionais_veiculo = self._parse_opcionais(v.get("opcionais"))
+        # Métodos usados no laço ligados a variáveis locais
+        _norm = self.normalize_vehicle
+        _preco = self.converter_preco
+        _cat = self.definir_categoria_veiculo
+        _moto = self.inferir_cilindrada_e_categoria_moto
+        _text = self._extract_text
+        _int = self._extract_int
+        _opcionais = self._parse_opcionais
+        _motor = self._extract_motor_from_version
+        _fotos = self._extract_photos
+        
+        def _build_record(v: Dict) -> Dict:
+            """Monta o veículo normalizado (usa os métodos ligados acima)"""
+            modelo_veiculo = _text(v.get("modelo"))
+            versao_veiculo = _text(v.get("versao"))
+            opcionais_veiculo = _opcionais(v.get("opcionais"))
             
             # Determina se é moto ou carro baseado em tipoveiculo
-            tipo_veiculo = self._extract_text(v.get("tipoveiculo")).lower()
-            is_moto = "moto" in tipo_veiculo or "motocicleta" in tipo_veiculo
+            tipo_original = _text(v.get("tipoveiculo"))
+            is_moto = "moto" in tipo_original.lower()  # cobre "motocicleta"
             
             # Tenta extrair categoria de "carroceria", senão usa definir_categoria_veiculo
-            categoria_final = self._extract_text(v.get("carroceria"))
+            categoria_final = _text(v.get("carroceria"))
             if not categoria_final:
-                categoria_final = self.definir_categoria_veiculo(modelo_veiculo, opcionais_veiculo)
+                categoria_final = _cat(modelo_veiculo, opcionais_veiculo)
             
             if is_moto:
-                cilindrada_final, _ = self.inferir_cilindrada_e_categoria_moto(
-                    modelo_veiculo, versao_veiculo
-                )
+                cilindrada_final, _ = _moto(modelo_veiculo, versao_veiculo)
             else:
                 cilindrada_final = None
             
-            parsed = self.normalize_vehicle({
-                "id": self._extract_text(v.get("id")),
-                "tipo": "moto" if is_moto else self._extract_text(v.get("tipoveiculo")),
-                "titulo": None,
-                "versao": versao_veiculo,
-                "marca": self._extract_text(v.get("marca")),
-                "modelo": modelo_veiculo,
-                "ano": self._extract_int(v.get("anomodelo")),
-                "ano_fabricacao": self._extract_int(v.get("anofabricacao")),
-                "km": self._extract_int(v.get("km") or v.get("quilometragem")),
-                "cor": self._extract_text(v.get("cor")),
-                "combustivel": self._extract_text(v.get("combustivel")),
-                "cambio": self._extract_text(v.get("cambio")),
-                "motor": self._extract_motor_from_version(versao_veiculo),
-                "portas": self._extract_int(v.get("portas")),
-                "categoria": categoria_final,
-                "cilindrada": cilindrada_final,
-                "preco": self.converter_preco(self._extract_text(v.get("preco"))),
-                "opcionais": opcionais_veiculo,
-                "fotos": self._extract_photos(v)
-            })
-            parsed_vehicles.append(parsed)
+            record = _RECORD_TEMPLATE.copy()
+            record["id"] = _text(v.get("id"))
+            record["tipo"] = "moto" if is_moto else tipo_original
+            record["versao"] = versao_veiculo
+            record["marca"] = _text(v.get("marca"))
+            record["modelo"] = modelo_veiculo
+            record["ano"] = _int(v.get("anomodelo"))
+            record["ano_fabricacao"] = _int(v.get("anofabricacao"))
+            record["km"] = _int(v.get("km") or v.get("quilometragem"))
+            record["cor"] = _text(v.get("cor"))
+            record["combustivel"] = _text(v.get("combustivel"))
+            record["cambio"] = _text(v.get("cambio"))
+            record["motor"] = _motor(versao_veiculo)
+            record["portas"] = _int(v.get("portas"))
+            record["categoria"] = categoria_final
+            record["cilindrada"] = cilindrada_final
+            record["preco"] = _preco(_text(v.get("preco")))
+            record["opcionais"] = opcionais_veiculo
+            record["fotos"] = _fotos(v)
+            return _norm(record)
         
-        return parsed_vehicles
+        # Compreensão de lista (LIST_APPEND) em vez de laço com append/atribuição
+        return [_build_record(v) for v in veiculos]
     
     def _extract_text(self, value: Any) -> str:
         """Extrai texto de campos que podem ser string, dict ou None"""
@@ -78,20 +97,18 @@ class DSAutoEstoqueParser(BaseParser):
     
     def _extract_int(self, value: Any) -> int:
         """Extrai inteiro de campos que podem ser string, dict ou None"""
+        # Inteiro puro (bool fica de fora) não precisa passar pelo texto
+        if type(value) is int:
+            return value
         text = self._extract_text(value)
         if text and text.isdigit():
             return int(text)
         return None
     
     def _parse_opcionais(self, opcionais: Any) -> str:
-        """Processa os opcionais do DSAutoEstoque"""
-        if isinstance(opcionais, dict) and "opcional" in opcionais:
-            opcional = opcionais["opcional"]
-            if isinstance(opcional, list):
-                return ", ".join(str(item) for item in opcional if item)
-            return str(opcional) if opcional else ""
-        elif isinstance(opcionais, list):
-            return ", ".join(str(item) for item in opcionais if item)
+        """Processa os opcionais do DSAutoEstoque (valor avulso fora de {"opcional": ...} vira "")"""
+        if (isinstance(opcionais, dict) and "opcional" in opcionais) or isinstance(opcionais, list):
+            return super()._parse_opcionais(opcionais)
         return ""
     
     def _clean_version(self, modelo: str, versao: str) -> str:
@@ -101,10 +118,7 @@ class DSAutoEstoqueParser(BaseParser):
         
         # Concatena modelo + versão limpa
         modelo_str = modelo.strip() if modelo else ""
-        versao_limpa = ' '.join(re.sub(
-            r'\b(\d\.\d|4x[0-4]|\d+v|diesel|flex|gasolina|manual|automático|4p)\b', 
-            '', versao, flags=re.IGNORECASE
-        ).split())
+        versao_limpa = ' '.join(_DS_CLEAN_RE.sub('', versao).split())
         
         if versao_limpa:
             return f"{modelo_str} {versao_limpa}".strip()
@@ -117,31 +131,37 @@ class DSAutoEstoqueParser(BaseParser):
             return None
         
         # Pega a primeira palavra da versão que geralmente é o motor
-        words = versao.strip().split()
+        # (maxsplit=1: não divide o restante da string)
+        words = versao.split(None, 1)
         return words[0] if words else None
     
     def _extract_photos(self, v: Dict) -> List[str]:
         """Extrai fotos do veículo DSAutoEstoque"""
         fotos_element = v.get("fotos")
-        if not fotos_element:
+        # Sem a estrutura esperada ({"foto": ...}) não há fotos a extrair
+        if not isinstance(fotos_element, dict):
             return []
         
-        # Assume fotos_element is dict with "foto" key
-        foto_elements = fotos_element.get("foto", [])
-        
+        foto_elements = fotos_element.get("foto", ())
         if isinstance(foto_elements, (dict, str)):
             # Single value
-            foto_elements = [foto_elements]
+            foto_elements = (foto_elements,)
+        elif not isinstance(foto_elements, list):
+            return []
         
+        _text = self._extract_text
         urls = []
         for foto in foto_elements:
             if isinstance(foto, str):
                 # Directly the URL
-                urls.append(foto)
+                url = foto
             elif isinstance(foto, dict):
                 # Extract from dict (text or url key)
-                url = self._extract_text(foto) or foto.get("url", "")
-                urls.append(url)
+                url = _text(foto) or foto.get("url", "")
+            else:
+                continue
+            # Remove query params
+            if url:
+                urls.append(url.partition("?")[0])
         
-        # Remove query params
-        return [url.split("?")[0] for url in urls if url]
+        return urls
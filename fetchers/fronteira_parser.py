@@ -8,9 +8,11 @@ from typing import Dict, List, Any
 class FronteiraParser(BaseParser):
     """Parser para dados da Fronteira Veículos"""
     
+    URL_FRAGMENTS = ("fronteiraveiculos.com",)
+    
     def can_parse(self, data: Any, url: str) -> bool:
         """Verifica se pode processar dados da Fronteira"""
-        return "fronteiraveiculos.com" in url.lower()
+        return self.matches_url(url.lower())
 
     def parse(self, data: Any, url: str) -> List[Dict]:
         """Processa dados da Fronteira"""
@@ -21,27 +23,34 @@ class FronteiraParser(BaseParser):
         if isinstance(ads, dict):
             ads = [ads]
         
+        # Métodos usados no laço ligados a variáveis locais
+        _norm = self.normalize_vehicle
+        _preco = self.converter_preco
+        _cat = self.definir_categoria_veiculo
+        _moto = self.inferir_cilindrada_e_categoria_moto
+        _fotos = self._extract_photos
         parsed_vehicles = []
+        parsed_vehicles_append = parsed_vehicles.append
         for v in ads:
             modelo_veiculo = v.get("modelo")
             versao_veiculo = v.get("titulo")
             opcionais_veiculo = v.get("opcionais") or ""
             
             # Determina se é moto ou carro
-            categoria_veiculo = v.get("CATEGORY", "").lower()
-            is_moto = categoria_veiculo == "motocicleta" or "moto" in categoria_veiculo
+            categoria_veiculo = (v.get("CATEGORY") or "").lower()
+            is_moto = "moto" in categoria_veiculo
             
             if is_moto:
-                cilindrada_final, categoria_final = self.inferir_cilindrada_e_categoria_moto(
+                cilindrada_final, categoria_final = _moto(
                     modelo_veiculo, versao_veiculo
                 )
                 tipo_final = "moto"
             else:
-                categoria_final = self.definir_categoria_veiculo(modelo_veiculo, opcionais_veiculo)
+                categoria_final = _cat(modelo_veiculo, opcionais_veiculo)
                 cilindrada_final = None
                 tipo_final = 'carro'
 
-            parsed = self.normalize_vehicle({
+            parsed = _norm({
                 "id": v.get("id"), 
                 "tipo": tipo_final, 
                 "titulo": v.get("titulo"), 
@@ -58,11 +67,11 @@ class FronteiraParser(BaseParser):
                 "portas": v.get("DOORS"), 
                 "categoria": categoria_final or v.get("BODY_TYPE"),
                 "cilindrada": cilindrada_final, 
-                "preco": self.converter_preco(v.get("preco")),
+                "preco": _preco(v.get("preco")),
                 "opcionais": opcionais_veiculo, 
-                "fotos": self._extract_photos(v)
+                "fotos": _fotos(v)
             })
-            parsed_vehicles.append(parsed)
+            parsed_vehicles_append(parsed)
         
         return parsed_vehicles
     
@@ -80,8 +89,11 @@ class FronteiraParser(BaseParser):
         if isinstance(images, str):
             return [images]
 
-        # Se várias fotos (lista de strings)
+        # Se várias fotos (lista de strings); no caso comum (só strings) a
+        # própria lista é devolvida, sem reconstruí-la (normalize_fotos gera uma nova)
         if isinstance(images, list):
+            if all(type(img) is str for img in images):
+                return images
             return [img for img in images if isinstance(img, str)]
 
         return []
@@ -5,17 +5,21 @@ from .base_parser import BaseParser
 from typing import Dict, List, Any
 import re
 
+# Tudo que não é dígito (removido do ID numa única passada)
+_NAO_DIGITOS_RE = re.compile(r'\D+')
+
 class RevendaiParser(BaseParser):
     """Parser para dados do Revendai"""
     
+    URL_FRAGMENTS = ("integrador.revendai",)
+    
     def can_parse(self, data: Any, url: str) -> bool:
         """Verifica se pode processar dados do Revendai"""
         # Proteção contra url None ou vazia
         if not url:
             return False
         
-        url = url.lower()
-        return "integrador.revendai" in url
+        return self.matches_url(url.lower())
     
     def parse(self, data: Any, url: str) -> List[Dict]:
         """Processa dados do Revendai"""
@@ -29,7 +33,12 @@ class RevendaiParser(BaseParser):
         if not veiculos or not isinstance(veiculos, list):
             return []
         
+        # Métodos usados no laço ligados a variáveis locais
+        _norm = self.normalize_vehicle
+        _cat = self.definir_categoria_veiculo
+        _moto = self.inferir_cilindrada_e_categoria_moto
         parsed_vehicles = []
+        parsed_vehicles_append = parsed_vehicles.append
         for v in veiculos:
             # Validação de cada veículo
             if not isinstance(v, dict):
@@ -43,20 +52,20 @@ class RevendaiParser(BaseParser):
             is_moto = tipo_veiculo == "moto" or "motocicleta" in tipo_veiculo
             
             if is_moto:
-                cilindrada_final, categoria_final = self.inferir_cilindrada_e_categoria_moto(
+                cilindrada_final, categoria_final = _moto(
                     modelo_veiculo, versao_veiculo
                 )
                 tipo_final = "moto"
             else:
-                categoria_final = self.definir_categoria_veiculo(modelo_veiculo, opcionais_veiculo)
+                categoria_final = _cat(modelo_veiculo, opcionais_veiculo)
                 cilindrada_final = v.get("cilindrada")
                 tipo_final = tipo_veiculo
             
             id_original = v.get("id", "")
-            numeros = re.findall(r'\d', str(id_original))  # Converte para string por segurança
-            id_final = ''.join(numeros[:5]) if len(numeros) >= 5 else ''.join(numeros)
+            # Primeiros 5 dígitos do ID (str() por segurança)
+            id_final = _NAO_DIGITOS_RE.sub('', str(id_original))[:5]
             
-            parsed = self.normalize_vehicle({
+            parsed = _norm({
                 "id": id_final,
                 "tipo": tipo_final,
                 "versao": versao_veiculo,
@@ -77,6 +86,6 @@ class RevendaiParser(BaseParser):
                 "opcionais": opcionais_veiculo,
                 "fotos": v.get("fotos", [])
             })
-            parsed_vehicles.append(parsed)
+            parsed_vehicles_append(parsed)
         
         return parsed_vehicles
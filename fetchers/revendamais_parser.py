@@ -8,10 +8,11 @@ from typing import Dict, List, Any
 class RevendamaisParser(BaseParser):
     """Parser para dados do Revendamais"""
     
+    URL_FRAGMENTS = ("revendamais.com.br", "heyveiculos")
+    
     def can_parse(self, data: Any, url: str) -> bool:
         """Verifica se pode processar dados do Revendamais ou Hey Veículos"""
-        url = url.lower()
-        return "revendamais.com.br" in url or "heyveiculos" in url
+        return self.matches_url(url.lower())
 
 
     def parse(self, data: Any, url: str) -> List[Dict]:
@@ -20,7 +21,14 @@ class RevendamaisParser(BaseParser):
         if isinstance(ads, dict): 
             ads = [ads]
         
+        # Métodos usados no laço ligados a variáveis locais
+        _norm = self.normalize_vehicle
+        _preco = self.converter_preco
+        _cat = self.definir_categoria_veiculo
+        _moto = self.inferir_cilindrada_e_categoria_moto
+        _fotos = self._extract_photos
         parsed_vehicles = []
+        parsed_vehicles_append = parsed_vehicles.append
         for v in ads:
             modelo_veiculo = v.get("MODEL")
             versao_veiculo = v.get("VERSION")
@@ -28,19 +36,19 @@ class RevendamaisParser(BaseParser):
             
             # Determina se é moto ou carro
             categoria_veiculo = v.get("CATEGORY", "").lower()
-            is_moto = categoria_veiculo == "motocicleta" or "moto" in categoria_veiculo
+            is_moto = "moto" in categoria_veiculo
             
             if is_moto:
-                cilindrada_final, categoria_final = self.inferir_cilindrada_e_categoria_moto(
+                cilindrada_final, categoria_final = _moto(
                     modelo_veiculo, versao_veiculo
                 )
                 tipo_final = "moto"
             else:
-                categoria_final = self.definir_categoria_veiculo(modelo_veiculo, opcionais_veiculo)
+                categoria_final = _cat(modelo_veiculo, opcionais_veiculo)
                 cilindrada_final = None
                 tipo_final = v.get("CATEGORY")
 
-            parsed = self.normalize_vehicle({
+            parsed = _norm({
                 "id": v.get("ID"), 
                 "tipo": tipo_final, 
                 "versao": v.get("TITLE"),
@@ -56,11 +64,11 @@ class RevendamaisParser(BaseParser):
                 "portas": v.get("DOORS"), 
                 "categoria": v.get("BODY_TYPE") or categoria_final,
                 "cilindrada": cilindrada_final, 
-                "preco": self.converter_preco(v.get("PRICE")),
+                "preco": _preco(v.get("PRICE")),
                 "opcionais": opcionais_veiculo, 
-                "fotos": self._extract_photos(v)
+                "fotos": _fotos(v)
             })
-            parsed_vehicles.append(parsed)
+            parsed_vehicles_append(parsed)
         
         return parsed_vehicles
     
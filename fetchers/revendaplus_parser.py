@@ -5,8 +5,13 @@ Parser específico para RevendaPlus (revendaplus.com.br)
 from .base_parser import BaseParser
 from typing import Dict, List, Any
 
+# Número no formato brasileiro ("55.900,50") para o formato do float() numa única passada
+_BR_NUM_TABLE = str.maketrans({".": None, ",": "."})
+
 class RevendaPlusParser(BaseParser):
     """Parser para dados do RevendaPlus"""
+    
+    URL_FRAGMENTS = ("revendaplus.com.br",)
 
     def _safe_float(self, value: Any, default: float = None) -> float:
         """Converte valor para float de forma segura"""
@@ -24,7 +29,7 @@ class RevendaPlusParser(BaseParser):
             
             try:
                 # Remove pontos e converte vírgula para ponto
-                value = value.replace(".", "").replace(",", ".")
+                value = value.translate(_BR_NUM_TABLE)
                 return float(value)
             except (ValueError, AttributeError):
                 return default
@@ -59,8 +64,7 @@ class RevendaPlusParser(BaseParser):
 
     def can_parse(self, data: Any, url: str) -> bool:
         """Verifica se pode processar dados do RevendaPlus"""
-        url = url.lower()
-        return "revendaplus.com.br" in url
+        return self.matches_url(url.lower())
 
     def parse(self, data: Any, url: str) -> List[Dict]:
         """Processa dados do RevendaPlus (JSON)"""
@@ -68,41 +72,47 @@ class RevendaPlusParser(BaseParser):
         if not isinstance(data, list):
             data = [data]
         
+        # Métodos usados no laço ligados a variáveis locais
+        _norm = self.normalize_vehicle
+        _cat = self.definir_categoria_veiculo
+        _float = self._safe_float
+        _int = self._safe_int
         parsed_vehicles = []
+        parsed_vehicles_append = parsed_vehicles.append
         for v in data:
             modelo_veiculo = v.get("modelo", "")
             opcionais_veiculo = v.get("opcionais") or ""
             
             # Determina se é moto ou carro baseado no tipo
             tipo_veiculo = v.get("tipo", "").lower()
-            is_moto = tipo_veiculo == "moto" or "moto" in tipo_veiculo
+            is_moto = "moto" in tipo_veiculo
             
             if is_moto:
                 # Para motos, usa a potência como cilindrada
                 potencia = v.get("potencia")
-                cilindrada_final = self._safe_int(potencia)
+                cilindrada_final = _int(potencia)
                 categoria_final = v.get("especie", "")
                 tipo_final = "moto"
             else:
-                categoria_final = self.definir_categoria_veiculo(modelo_veiculo, opcionais_veiculo)
+                categoria_final = _cat(modelo_veiculo, opcionais_veiculo)
                 cilindrada_final = None
                 tipo_final = v.get("tipo", "")
 
             # Converte km de forma segura
-            km_value = self._safe_float(v.get("km"))
+            km_value = _float(v.get("km"))
             
             # Converte preço de forma segura
-            preco_value = self._safe_float(v.get("valor"))
+            preco_value = _float(v.get("valor"))
 
             # Converte anos de forma segura
-            ano_value = self._safe_int(v.get("ano_modelo"))
-            ano_fab_value = self._safe_int(v.get("ano_fabricacao"))
+            ano_value = _int(v.get("ano_modelo"))
+            ano_fab_value = _int(v.get("ano_fabricacao"))
 
             # Remove zeros à esquerda do ID
             codigo = v.get("codigo", "")
-            id_final = self._safe_int(codigo)
+            id_final = _int(codigo)
 
-            parsed = self.normalize_vehicle({
+            parsed = _norm({
                 "id": id_final,
                 "tipo": tipo_final,
                 "versao": v.get("modelo"),
@@ -122,6 +132,6 @@ class RevendaPlusParser(BaseParser):
                 "opcionais": opcionais_veiculo,
                 "fotos": v.get("fotos", [])
             })
-            parsed_vehicles.append(parsed)
+            parsed_vehicles_append(parsed)
         
         return parsed_vehicles
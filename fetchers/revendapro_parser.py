@@ -9,9 +9,11 @@ import re
 class RevendaproParser(BaseParser):
     """Parser para dados do RevendaPro"""
     
+    URL_FRAGMENTS = ("revendapro.com.br",)
+    
     def can_parse(self, data: Any, url: str) -> bool:
         """Verifica se pode processar dados do RevendaPro"""
-        return "revendapro.com.br" in url.lower()
+        return self.matches_url(url.lower())
 
     def parse(self, data: Any, url: str) -> List[Dict]:
         """Processa dados do RevendaPro"""
@@ -22,7 +24,15 @@ class RevendaproParser(BaseParser):
         if isinstance(ads, dict):
             ads = [ads]
         
+        # Métodos usados no laço ligados a variáveis locais
+        _norm = self.normalize_vehicle
+        _preco = self.converter_preco
+        _cat = self.definir_categoria_veiculo
+        _moto = self.inferir_cilindrada_e_categoria_moto
+        _motor = self._extract_motor_from_version
+        _fotos = self._extract_photos
         parsed_vehicles = []
+        parsed_vehicles_append = parsed_vehicles.append
         for v in ads:
             modelo_veiculo = v.get("Modelo")
             versao_veiculo = v.get("Versao")
@@ -30,17 +40,17 @@ class RevendaproParser(BaseParser):
             
             # Determina se é moto ou carro
             categoria_veiculo = v.get("Tipo", "").lower()
-            is_moto = categoria_veiculo == "motocicleta" or "moto" in categoria_veiculo
+            is_moto = "moto" in categoria_veiculo
             
             if is_moto:
-                cilindrada_final, categoria_final = self.inferir_cilindrada_e_categoria_moto(
+                cilindrada_final, categoria_final = _moto(
                     modelo_veiculo, versao_veiculo
                 )
             else:
-                categoria_final = self.definir_categoria_veiculo(modelo_veiculo, opcionais_veiculo)
+                categoria_final = _cat(modelo_veiculo, opcionais_veiculo)
                 cilindrada_final = None
 
-            parsed = self.normalize_vehicle({
+            parsed = _norm({
                 "id": v.get("Codigo"), 
                 "tipo": v.get("Tipo"), 
                 "titulo": v.get(""), 
@@ -53,15 +63,15 @@ class RevendaproParser(BaseParser):
                 "cor": v.get("Cor"),
                 "combustivel": v.get("Combustivel"), 
                 "cambio": v.get("Cambio"), 
-                "motor": self._extract_motor_from_version(v.get("Versao")),
+                "motor": _motor(v.get("Versao")),
                 "portas": v.get("Portas"), 
                 "categoria": categoria_final,
                 "cilindrada": cilindrada_final, 
-                "preco": self.converter_preco(v.get("Preco")),
+                "preco": _preco(v.get("Preco")),
                 "opcionais": opcionais_veiculo, 
-                "fotos": self._extract_photos(v)
+                "fotos": _fotos(v)
             })
-            parsed_vehicles.append(parsed)
+            parsed_vehicles_append(parsed)
         
         return parsed_vehicles
     
@@ -71,7 +81,7 @@ class RevendaproParser(BaseParser):
             return ""
         
         # Pega a primeira palavra da versão que geralmente é o motor
-        words = versao.strip().split()
+        words = versao.split(None, 1)
         return words[0] if words else ""
     
     def _extract_photos(self, v: Dict[str, Any]) -> List[str]:
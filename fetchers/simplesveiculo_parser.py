@@ -7,12 +7,17 @@ from typing import Dict, List, Any, Optional
 import requests
 import os
 
+# Remove separadores de milhar/decimal da quilometragem numa única passada
+_KM_DELETE = str.maketrans("", "", ",.")
+
 class SimplesVeiculoParser(BaseParser):
     """Parser para dados do SimplesVeiculo"""
     
+    URL_FRAGMENTS = ("simplesveiculo.com.br",)
+    
     def can_parse(self, data: Any, url: str) -> bool:
         """Verifica se pode processar dados do SimplesVeiculo"""
-        return "simplesveiculo.com.br" in url.lower()
+        return self.matches_url(url.lower())
     
     def parse(self, data: Any, url: str) -> List[Dict]:
         """Processa dados do SimplesVeiculo"""
@@ -23,7 +28,22 @@ class SimplesVeiculoParser(BaseParser):
         if isinstance(veiculos, dict):
             veiculos = [veiculos]
         
+        # Métodos usados no laço ligados a variáveis locais
+        _norm = self.normalize_vehicle
+        _preco = self.converter_preco
+        _cat = self.definir_categoria_veiculo
+        _moto = self.inferir_cilindrada_e_categoria_moto
+        _versao = self._clean_version
+        _motor_info = self._extract_motor_info
+        _int = self._safe_int
+        _km = self._extract_mileage
+        _modelo_base = self._extract_modelo_base
+        _fotos = self._extract_photos_simples
+        _combustivel = self._map_fuel_type
+        _cambio = self._map_transmission
+        _cor = self._normalize_color
         parsed_vehicles = []
+        parsed_vehicles_append = parsed_vehicles.append
         
         for v in veiculos:
             if not isinstance(v, dict):
@@ -35,53 +55,53 @@ class SimplesVeiculoParser(BaseParser):
             marca = v.get("make", "")
             
             # Extrai modelo base da string completa
-            modelo_final = self._extract_modelo_base(modelo_completo, marca)
+            modelo_final = _modelo_base(modelo_completo, marca)
             
             # Processa quilometragem
-            km_final = self._extract_mileage(v.get("mileage", {}))
+            km_final = _km(v.get("mileage", {}))
             
             # Determina se é moto ou carro
             vehicle_type = v.get("vehicle_type", "").lower()
             
             # SimplesVeiculo usa 'car_truck' para carros e 'motorcycle' para motos
-            is_moto = vehicle_type == "motorcycle" or "moto" in vehicle_type
+            is_moto = "moto" in vehicle_type
             
             if is_moto:
                 # Para motos: usa o sistema com modelo E versão
-                cilindrada_final, categoria_final = self.inferir_cilindrada_e_categoria_moto(
+                cilindrada_final, categoria_final = _moto(
                     modelo_final, modelo_completo
                 )
                 tipo_final = "moto"
             else:
                 # Para carros: usa o sistema existente
-                categoria_final = self.definir_categoria_veiculo(modelo_final, "")
+                categoria_final = _cat(modelo_final, "")
                 cilindrada_final = None
                 tipo_final = "carro"
             
             # Extrai informações do motor da descrição/modelo
-            motor_info = self._extract_motor_info(modelo_completo)
+            motor_info = _motor_info(modelo_completo)
             
             # Processa combustível
-            combustivel_final = self._map_fuel_type(v.get("fuel_type", ""))
+            combustivel_final = _combustivel(v.get("fuel_type", ""))
             
             # Processa câmbio
-            cambio_final = self._map_transmission(v.get("transmission", ""))
+            cambio_final = _cambio(v.get("transmission", ""))
             
             # BUSCA O PREÇO DA FONTE SECUNDÁRIA
             preco_secundario = self._fetch_price_from_secondary_source(vehicle_id)
-            preco_final = preco_secundario if preco_secundario is not None else self.converter_preco(v.get("price"))
+            preco_final = preco_secundario if preco_secundario is not None else _preco(v.get("price"))
             
-            parsed = self.normalize_vehicle({
+            parsed = _norm({
                 "id": vehicle_id,
                 "tipo": tipo_final,
                 "titulo": titulo,
-                "versao": self._clean_version(modelo_completo, marca),
+                "versao": _versao(modelo_completo, marca),
                 "marca": marca,
                 "modelo": modelo_final,
-                "ano": self._safe_int(v.get("year")),
+                "ano": _int(v.get("year")),
                 "ano_fabricacao": None,  # SimplesVeiculo não fornece separadamente
                 "km": km_final,
-                "cor": self._normalize_color(v.get("exterior_color", "")),
+                "cor": _cor(v.get("exterior_color", "")),
                 "combustivel": combustivel_final,
                 "cambio": cambio_final,
                 "motor": motor_info,
@@ -90,10 +110,10 @@ class SimplesVeiculoParser(BaseParser):
                 "cilindrada": cilindrada_final,
                 "preco": preco_final,
                 "opcionais": v.get("description"),  # SimplesVeiculo não fornece opcionais neste formato
-                "fotos": self._extract_photos_simples(v)
+                "fotos": _fotos(v)
             })
             
-            parsed_vehicles.append(parsed)
+            parsed_vehicles_append(parsed)
         
         return parsed_vehicles
     
@@ -135,7 +155,7 @@ class SimplesVeiculoParser(BaseParser):
             modelo_sem_marca = modelo_completo[len(marca):].strip()
         
         # Pega a primeira palavra que geralmente é o modelo
-        palavras = modelo_sem_marca.strip().split()
+        palavras = modelo_sem_marca.split(None, 1)
         if palavras:
             return palavras[0]
         
@@ -147,9 +167,12 @@ class SimplesVeiculoParser(BaseParser):
             return None
         
         value = mileage_data.get("value")
+        if type(value) is int:
+            # Já numérico: dispensa a conversão via string
+            return value or None
         if value:
             try:
-                return int(float(str(value).replace(",", "").replace(".", "")))
+                return int(float(str(value).translate(_KM_DELETE)))
             except (ValueError, TypeError):
                 return None
         
@@ -3,13 +3,118 @@ Parser específico para WordPress/WooCommerce de veículos
 """
 from .base_parser import BaseParser
 from typing import Dict, List, Any, Optional, Tuple
+import logging
 import re
 
+# Mensagens de depuração (desligadas por padrão; não formatadas se o nível DEBUG estiver inativo)
+logger = logging.getLogger(__name__)
+
+# Padrões compilados uma única vez no carregamento do módulo
+_MOTOR_RE = re.compile(r'\b(\d+\.\d+)\b')
+_CLEAN_TECH_RE = re.compile(r'\b(\d+\.\d+|16V|TB|Flex|Aut\.|Manual|4p|2p)\b', re.IGNORECASE)
+_WS_RE = re.compile(r'\s+')
+
+# Extensões de imagem cujo sufixo "-<número>" define a ordem das fotos
+_PHOTO_EXTENSIONS = frozenset(("avif", "jpg", "jpeg", "png", "webp"))
+_PHOTO_SEM_NUMERO = 999999
+
+_CDATA_INICIO = '<![CDATA['
+_CDATA_FIM = ']]>'
+
+def _strip_cdata(value: str) -> str:
+    """Remove o invólucro CDATA e os espaços das bordas (value deve começar com '<![CDATA[')"""
+    if value.endswith(_CDATA_FIM):
+        interno = value[len(_CDATA_INICIO):-len(_CDATA_FIM)]
+        # Caso comum: um único invólucro, removido com uma fatia só
+        if _CDATA_INICIO not in interno and _CDATA_FIM not in interno:
+            return interno.strip()
+    return value.replace(_CDATA_INICIO, '').replace(_CDATA_FIM, '').strip()
+
+# Campos de fotos na ordem de tentativa: prioritários e depois alternativos (rótulo usado na depuração)
+_FOTO_CAMPOS = tuple(
+    [(campo, "campo") for campo in ("_galeria", "ImageURL", "ImageFeatured")]
+    + [(campo, "campo alternativo") for campo in ("galeria", "_imagens", "imagens", "fotos", "_fotos", "images", "_images")]
+)
+
+# Campos do post e seus nomes alternativos, na ordem de preferência
+_FIELD_ALIASES = {
+    "id": ("ID", "id", "_id"),
+    "marca": ("Marca", "marca", "_marca"),
+    "modelo": ("Modelo", "modelo", "_modelo"),
+    "versao": ("Verso", "versao", "_versao", "Version"),
+    "carroceria": ("_carroceria", "carroceria", "Carroceria"),
+    "opcionais": ("Opcionais", "opcionais", "_opcionais"),
+    "cor": ("Cores", "cor", "_cor", "Color"),
+    "ano": ("_ano", "ano", "Ano", "Year"),
+    "km": ("_quilometragem", "quilometragem", "KM", "km"),
+    "combustivel": ("_combustivel", "combustivel", "Combustivel"),
+    "cambio": ("_cambio", "cambio", "Cambio"),
+    "preco": ("_valor", "valor", "preco", "Preco", "Price"),
+}
+
+def _canonicalize_post(post: Dict) -> Dict[str, Optional[str]]:
+    """Lê de uma vez todos os campos do post pelo primeiro nome presente (sem CDATA; vazio vira None)"""
+    campos = {}
+    get = post.get
+    for canonico, aliases in _FIELD_ALIASES.items():
+        valor = None
+        for alias in aliases:
+            bruto = get(alias)
+            if bruto is not None:
+                if isinstance(bruto, str) and bruto.startswith(_CDATA_INICIO):
+                    bruto = _strip_cdata(bruto)
+                valor = str(bruto).strip() or None
+                break
+        campos[canonico] = valor
+    return campos
+
+def _photo_number(url: str) -> int:
+    """Número no fim do nome da foto ("...-12.jpg" -> 12), com varredura pelo fim da string"""
+    base, ponto, extensao = url.rpartition('.')
+    if ponto and extensao.lower() in _PHOTO_EXTENSIONS:
+        _, hifen, numero = base.rpartition('-')
+        if hifen and numero.isdecimal():
+            return int(numero)
+    return _PHOTO_SEM_NUMERO
+
+def _extract_urls(item: Any) -> List[str]:
+    """URLs de um item de fotos (string com uma ou várias URLs, ou dict com chave de URL)"""
+    if isinstance(item, str):
+        url = item.strip()
+        if not url:
+            return []
+        
+        # URLs separadas por pipe ou vírgula
+        if "|" in url:
+            return [u.strip() for u in url.split("|") if u.strip()]
+        elif "," in url:
+            urls = [u.strip() for u in url.split(",") if u.strip()]
+            valid_urls = []
+            for u in urls:
+                if ("http" in u or u.startswith("/")) and len(u) > 10:
+                    valid_urls.append(u)
+            return valid_urls
+        else:
+            return [url] if url else []
+            
+    elif isinstance(item, dict):
+        # Procura por chaves comuns de URL
+        for key in ["url", "URL", "src", "IMAGE_URL", "path", "link", "href"]:
+            if key in item and item[key]:
+                url = str(item[key]).strip()
+                clean_url = url.partition("?")[0].rstrip()
+                return [clean_url] if clean_url else []
+    return []
+
 class WordPressParser(BaseParser):
     """Parser para dados do WordPress/WooCommerce de veículos"""
     
     def can_parse(self, data: Any, url: str) -> bool:
         """Verifica se pode processar dados do WordPress"""
+        return self.can_parse_data(data)
+    
+    def can_parse_data(self, data: Any) -> bool:
+        """Verifica se os dados têm a estrutura típica do WordPress"""
         if not isinstance(data, dict):
             return False
         
@@ -27,54 +132,65 @@ class WordPressParser(BaseParser):
     def parse(self, data: Any, url: str) -> List[Dict]:
         """Processa dados do WordPress"""
         posts = self._extract_posts(data)
+        
+        # Métodos usados no laço ligados a variáveis locais
+        _norm = self.normalize_vehicle
+        _preco = self.converter_preco
+        _cat = self.definir_categoria_veiculo
+        _fotos = self._extract_photos
+        _versao = self._clean_version
+        _motor_info = self._extract_motor_info
+        _anos = self._extract_anos
+        _campos = _canonicalize_post
         parsed_vehicles = []
+        parsed_vehicles_append = parsed_vehicles.append
         
         for post in posts:
             if not isinstance(post, dict):
                 continue
             
-            # Debug apenas para o primeiro post
-            if len(parsed_vehicles) == 0:
-                print(f"[DEBUG] Campos disponíveis no XML:")
+            # Debug apenas para o primeiro post (removido por completo com python -O)
+            if __debug__ and not parsed_vehicles and logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Campos disponíveis no XML:")
                 for key in sorted(post.keys()):
                     value = post[key]
                     if isinstance(value, str) and len(value) > 50:
                         value = value[:50] + "..."
-                    print(f"  {key}: {value}")
-                print()
+                    logger.debug("  %s: %s", key, value)
             
-            # Extrai dados básicos
-            marca = self._safe_get_post_field(post, ["Marca", "marca", "_marca"])
-            modelo = self._safe_get_post_field(post, ["Modelo", "modelo", "_modelo"])
-            versao = self._safe_get_post_field(post, ["Verso", "versao", "_versao", "Version"])
-            carroceria = self._safe_get_post_field(post, ["_carroceria", "carroceria", "Carroceria"])
-            opcionais = self._safe_get_post_field(post, ["Opcionais", "opcionais", "_opcionais"])
+            # Extrai dados básicos (todos os campos numa só passada pelo post)
+            campos = _campos(post)
+            marca = campos["marca"]
+            modelo = campos["modelo"]
+            versao = campos["versao"]
+            carroceria = campos["carroceria"]
+            opcionais = campos["opcionais"]
             
             # Campos específicos
-            cor = self._safe_get_post_field(post, ["Cores", "cor", "_cor", "Color"])
-            ano_campo = self._safe_get_post_field(post, ["_ano", "ano", "Ano", "Year"])
-            km = self._safe_get_post_field(post, ["_quilometragem", "quilometragem", "KM", "km"])
-            combustivel = self._safe_get_post_field(post, ["_combustivel", "combustivel", "Combustivel"])
-            cambio = self._safe_get_post_field(post, ["_cambio", "cambio", "Cambio"])
-            preco = self._safe_get_post_field(post, ["_valor", "valor", "preco", "Preco", "Price"])
+            cor = campos["cor"]
+            ano_campo = campos["ano"]
+            km = campos["km"]
+            combustivel = campos["combustivel"]
+            cambio = campos["cambio"]
+            preco = campos["preco"]
             
             # Processa anos
-            ano_fabricacao, ano_modelo = self._extract_anos(ano_campo)
+            ano_fabricacao, ano_modelo = _anos(ano_campo)
             
             # Determina categoria
-            categoria_final = self.definir_categoria_veiculo(modelo, opcionais)
+            categoria_final = _cat(modelo, opcionais)
             
             # Extrai motor
-            motor_info = self._extract_motor_info(versao or "")
+            motor_info = _motor_info(versao or "")
             
             # Processa fotos
-            fotos = self._extract_photos(post)
+            fotos = _fotos(post)
             
             # Monta veículo
-            parsed = self.normalize_vehicle({
-                "id": self._safe_get_post_field(post, ["ID", "id", "_id"]),
+            parsed = _norm({
+                "id": campos["id"],
                 "tipo": "carro",
-                "versao": self._clean_version(versao or ""),
+                "versao": _versao(versao or ""),
                 "marca": marca,
                 "modelo": modelo,
                 "ano": ano_modelo,
@@ -87,12 +203,12 @@ class WordPressParser(BaseParser):
                 "portas": None,
                 "categoria": categoria_final,
                 "cilindrada": None,
-                "preco": self.converter_preco(preco),
+                "preco": _preco(preco),
                 "opcionais": opcionais or "",
                 "fotos": fotos
             })
             
-            parsed_vehicles.append(parsed)
+            parsed_vehicles_append(parsed)
         
         return parsed_vehicles
     
@@ -127,21 +243,6 @@ class WordPressParser(BaseParser):
         
         return posts
     
-    def _safe_get_post_field(self, post: Dict, fields: List[str]) -> Optional[str]:
-        """Extrai campo do post com fallbacks e limpeza de CDATA"""
-        for field in fields:
-            if field in post and post[field] is not None:
-                value = post[field]
-                
-                # Remove CDATA se presente
-                if isinstance(value, str) and value.startswith('<![CDATA['):
-                    value = value.replace('<![CDATA[', '').replace(']]>', '').strip()
-                
-                if value is not None:
-                    str_value = str(value).strip()
-                    return str_value if str_value else None
-        return None
-    
     def _extract_anos(self, ano_campo: str) -> Tuple[Optional[str], Optional[str]]:
         """Extrai ano de fabricação e modelo do campo de ano"""
         if not ano_campo:
@@ -161,44 +262,23 @@ class WordPressParser(BaseParser):
     
     def _extract_photos(self, post: Dict) -> List[str]:
         """Extrai fotos do veículo WordPress"""
-        # Campos prioritários para fotos
-        foto_fields_priority = [
-            "_galeria",
-            "ImageURL", 
-            "ImageFeatured",
-        ]
-        
-        # Tenta campos prioritários primeiro
-        for field in foto_fields_priority:
-            if field in post and post[field]:
-                value = post[field]
-                
-                # Remove CDATA se presente
-                if isinstance(value, str) and value.startswith('<![CDATA['):
-                    value = value.replace('<![CDATA[', '').replace(']]>', '').strip()
-                
-                fotos_normalizadas = self._normalize_fotos(value)
-                
-                if fotos_normalizadas:
-                    print(f"[DEBUG] Usando campo '{field}' para fotos: {len(fotos_normalizadas)} foto(s)")
-                    return fotos_normalizadas
-        
-        # Campos alternativos
-        outros_campos = ["galeria", "_imagens", "imagens", "fotos", "_fotos", "images", "_images"]
-        for field in outros_campos:
-            if field in post and post[field]:
-                value = post[field]
-                
-                # Remove CDATA se presente
-                if isinstance(value, str) and value.startswith('<![CDATA['):
-                    value = value.replace('<![CDATA[', '').replace(']]>', '').strip()
-                
-                fotos_normalizadas = self._normalize_fotos(value)
-                if fotos_normalizadas:
-                    print(f"[DEBUG] Usando campo alternativo '{field}' para fotos: {len(fotos_normalizadas)} foto(s)")
-                    return fotos_normalizadas
+        for field, rotulo in _FOTO_CAMPOS:
+            value = post.get(field)
+            if not value:
+                continue
+            
+            # Remove CDATA se presente
+            if isinstance(value, str) and value.startswith(_CDATA_INICIO):
+                value = _strip_cdata(value)
+            
+            fotos_normalizadas = self._normalize_fotos(value)
+            if fotos_normalizadas:
+                if __debug__:
+                    logger.debug("Usando %s '%s' para fotos: %d foto(s)", rotulo, field, len(fotos_normalizadas))
+                return fotos_normalizadas
         
-        print(f"[DEBUG] Nenhuma foto encontrada para este veículo")
+        if __debug__:
+            logger.debug("Nenhuma foto encontrada para este veículo")
         return []
     
     def _normalize_fotos(self, fotos_data: Any) -> List[str]:
@@ -208,76 +288,33 @@ class WordPressParser(BaseParser):
         
         result = []
         
-        def extract_url_from_item(item):
-            if isinstance(item, str):
-                url = item.strip()
-                if not url:
-                    return []
-                
-                # URLs separadas por pipe ou vírgula
-                if "|" in url:
-                    return [u.strip() for u in url.split("|") if u.strip()]
-                elif "," in url:
-                    urls = [u.strip() for u in url.split(",") if u.strip()]
-                    valid_urls = []
-                    for u in urls:
-                        if ("http" in u or u.startswith("/")) and len(u) > 10:
-                            valid_urls.append(u)
-                    return valid_urls
-                else:
-                    return [url] if url else []
-                    
-            elif isinstance(item, dict):
-                # Procura por chaves comuns de URL
-                for key in ["url", "URL", "src", "IMAGE_URL", "path", "link", "href"]:
-                    if key in item and item[key]:
-                        url = str(item[key]).strip()
-                        clean_url = url.split("?")[0] if "?" in url else url
-                        return [clean_url] if clean_url else []
-            return []
-        
-        def process_item(item):
-            if isinstance(item, str):
-                urls = extract_url_from_item(item)
-                result.extend(urls)
-            elif isinstance(item, list):
-                for subitem in item:
-                    process_item(subitem)
-            elif isinstance(item, dict):
-                urls = extract_url_from_item(item)
-                result.extend(urls)
-        
-        if isinstance(fotos_data, list):
-            for item in fotos_data:
-                process_item(item)
-        else:
-            process_item(fotos_data)
+        # Percorre listas aninhadas com pilha explícita (um único frame, sem limite de recursão);
+        # os itens entram invertidos para manter a ordem original
+        pendentes = [fotos_data]
+        while pendentes:
+            item = pendentes.pop()
+            if isinstance(item, list):
+                pendentes.extend(reversed(item))
+            elif isinstance(item, (str, dict)):
+                result.extend(_extract_urls(item))
         
-        # Remove duplicatas
-        seen = set()
-        normalized = []
-        for url in result:
-            if url and url not in seen and url.strip() and len(url) > 10:
-                seen.add(url)
-                normalized.append(url.strip())
+        # Remove duplicatas mantendo a ordem; _extract_urls já devolve as URLs sem espaços nas bordas
+        normalized = list(dict.fromkeys(url for url in result if len(url) > 10))
         
-        # Ordena por número se possível
-        def extract_number(url):
-            pattern = r'-(\d+)\.(?:avif|jpg|jpeg|png|webp)$'
-            match = re.search(pattern, url, re.IGNORECASE)
-            if match:
-                return int(match.group(1))
-            return 999999
+        # Ordena por número se possível; feeds que já vêm em ordem dispensam a ordenação
+        numeros = [_photo_number(url) for url in normalized]
+        if all(atual <= proximo for atual, proximo in zip(numeros, numeros[1:])):
+            return normalized
         
-        normalized.sort(key=extract_number)
-        return normalized
+        # Ordena os índices pelas chaves já calculadas (estável, como o sort por chave)
+        return [normalized[i] for i in sorted(range(len(normalized)), key=numeros.__getitem__)]
     
     def _extract_motor_info(self, versao: str) -> Optional[str]:
         """Extrai informação do motor da versão"""
         if not versao:
             return None
         
-        motor_match = re.search(r'\b(\d+\.\d+)\b', versao)
+        motor_match = _MOTOR_RE.search(versao)
         return motor_match.group(1) if motor_match else None
     
     def _clean_version(self, versao: str) -> str:
@@ -286,7 +323,7 @@ class WordPressParser(BaseParser):
             return ""
         
         # Remove informações técnicas comuns
-        versao_limpa = re.sub(r'\b(\d+\.\d+|16V|TB|Flex|Aut\.|Manual|4p|2p)\b', '', versao, flags=re.IGNORECASE)
-        versao_limpa = re.sub(r'\s+', ' ', versao_limpa).strip()
+        versao_limpa = _CLEAN_TECH_RE.sub('', versao)
+        versao_limpa = _WS_RE.sub(' ', versao_limpa).strip()
         
         return versao_limpa
@@ -1,15 +1,28 @@
 from fastapi import FastAPI, Request
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, Response, StreamingResponse
 from unidecode import unidecode
-from rapidfuzz import fuzz
+from rapidfuzz import fuzz, process
 from apscheduler.schedulers.background import BackgroundScheduler
 from xml_fetcher import fetch_and_convert_xml
 from vehicle_mappings import MAPEAMENTO_CATEGORIAS, MAPEAMENTO_MOTOS
+import asyncio
+import hashlib
 import json
+import mmap
 import os
+import threading
+from bisect import bisect_right
+from collections import deque
 from datetime import datetime
-from typing import Dict, List, Optional, Any, Tuple
-from dataclasses import dataclass
+from functools import lru_cache
+from typing import Callable, Dict, Iterator, List, Optional, Any, Tuple
+from dataclasses import dataclass, field
+
+try:
+    # Decodificação/serialização JSON em código nativo quando disponível
+    import orjson
+except ImportError:
+    orjson = None
 
 app = FastAPI()
 
@@ -20,6 +33,15 @@ FALLBACK_PRIORITY = [
     "KmMax", "AnoMax", "modelo", "marca", "categoria"
 ]
 
+# Máximo de respostas serializadas do /list guardadas por versão de data.json
+LIST_PAYLOAD_CACHE_SIZE = 128
+
+# Tabelas de str.translate: cada limpeza de texto numa única passada
+KM_TRANSLATE_TABLE = str.maketrans("", "", ".,")
+YEAR_TRANSLATE_TABLE = str.maketrans("", "", "\n\r ")
+CC_TRANSLATE_TABLE = str.maketrans({",": ".", "L": None, "l": None})
+NORMALIZE_TRANSLATE_TABLE = str.maketrans("", "", "- ")
+
 # Dicionário de mapeamento de opcionais para códigos
 OPCIONAIS_MAP = {
     1: ["ar-condicionado", "ar condicionado", "arcondicionado", "ar-condiciona", "ar condiciona"],
@@ -40,6 +62,12 @@ def normalizar_opcional(texto: str) -> str:
     texto = " ".join(texto.split())
     return texto.strip()
 
+# Variações de OPCIONAIS_MAP já normalizadas (calculadas uma vez, não a cada opcional)
+_OPCIONAIS_MAP_NORMALIZADO = [
+    (codigo, [normalizar_opcional(variacao) for variacao in variacoes])
+    for codigo, variacoes in OPCIONAIS_MAP.items()
+]
+
 def opcionais_para_codigos(opcionais_str: str) -> List[int]:
     """Converte string de opcionais em lista de códigos"""
     if not opcionais_str:
@@ -53,15 +81,141 @@ def opcionais_para_codigos(opcionais_str: str) -> List[int]:
         if not opcional_norm:
             continue
             
-        for codigo, variacoes in OPCIONAIS_MAP.items():
-            for variacao in variacoes:
-                variacao_norm = normalizar_opcional(variacao)
+        for codigo, variacoes_norm in _OPCIONAIS_MAP_NORMALIZADO:
+            for variacao_norm in variacoes_norm:
                 if opcional_norm == variacao_norm or variacao_norm in opcional_norm:
                     codigos.add(codigo)
                     break
     
     return sorted(list(codigos))
 
+@lru_cache(maxsize=131072)
+def _normalize_text(text: str) -> str:
+    """Texto sem acentos, minúsculo e sem hífens/espaços (valores repetem entre veículos e buscas)"""
+    return unidecode(text).lower().translate(NORMALIZE_TRANSLATE_TABLE).strip()
+
+# Conversões numéricas memoizadas: os mesmos ano/km/preço/cilindrada voltam a cada filtro,
+# ordenação e passo de fallback (None quando o texto não é numérico, também memoizado)
+@lru_cache(maxsize=16384)
+def _price_from_text(text: str) -> Optional[float]:
+    try:
+        cleaned = text.replace(",", "").replace("R$", "").replace(".", "").strip()
+        return float(cleaned) / 100 if len(cleaned) > 2 else float(cleaned)
+    except ValueError:
+        return None
+
+@lru_cache(maxsize=16384)
+def _year_from_text(text: str) -> Optional[int]:
+    try:
+        return int(text.translate(YEAR_TRANSLATE_TABLE))
+    except ValueError:
+        return None
+
+@lru_cache(maxsize=16384)
+def _km_from_text(text: str) -> Optional[int]:
+    try:
+        # int() já ignora espaços nas pontas; basta remover os separadores
+        return int(text.translate(KM_TRANSLATE_TABLE))
+    except ValueError:
+        return None
+
+@lru_cache(maxsize=16384)
+def _cc_from_text(text: str) -> Optional[float]:
+    try:
+        value = float(text.translate(CC_TRANSLATE_TABLE))
+    except ValueError:
+        return None
+    if value < 10:
+        return value * 1000
+    return value
+
+class KeySubstringMatcher:
+    """
+    Primeira chave de um mapeamento (na ordem do dict) contida no texto ou que contém o texto,
+    o mesmo que percorrer `key in texto or texto in key`, sem varrer todas as chaves:
+    - chaves contidas no texto: autômato de Aho-Corasick, uma passada pelos caracteres do texto;
+    - chaves que contêm o texto: um único str.find na concatenação das chaves.
+    """
+
+    _SEPARADOR = "\n"
+
+    def __init__(self, chaves: List[str]):
+        self.chaves = list(chaves)
+        sem_chave = len(self.chaves)
+        # Autômato: transições, links de falha e menor índice de chave reconhecida em cada estado
+        self._transicoes: List[Dict[str, int]] = [{}]
+        self._falha = [0]
+        self._menor = [sem_chave]
+        for indice, chave in enumerate(self.chaves):
+            estado = 0
+            for caractere in chave:
+                proximo = self._transicoes[estado].get(caractere)
+                if proximo is None:
+                    proximo = len(self._transicoes)
+                    self._transicoes[estado][caractere] = proximo
+                    self._transicoes.append({})
+                    self._falha.append(0)
+                    self._menor.append(sem_chave)
+                estado = proximo
+            self._menor[estado] = min(self._menor[estado], indice)
+        fila = deque(self._transicoes[0].values())
+        while fila:
+            estado = fila.popleft()
+            for caractere, filho in self._transicoes[estado].items():
+                fila.append(filho)
+                falha = self._falha[estado]
+                while falha and caractere not in self._transicoes[falha]:
+                    falha = self._falha[falha]
+                self._falha[filho] = self._transicoes[falha].get(caractere, 0)
+                self._menor[filho] = min(self._menor[filho], self._menor[self._falha[filho]])
+        # Chaves concatenadas e a posição inicial de cada uma (para achar a chave que contém o texto)
+        self._concatenadas = self._SEPARADOR.join(self.chaves)
+        self._separador_nas_chaves = any(self._SEPARADOR in chave for chave in self.chaves)
+        self._inicios = []
+        posicao = 0
+        for chave in self.chaves:
+            self._inicios.append(posicao)
+            posicao += len(chave) + len(self._SEPARADOR)
+
+    def first_match(self, texto: str) -> Optional[str]:
+        if self._SEPARADOR in texto or self._separador_nas_chaves:
+            # Separador no texto ou nas chaves: a concatenação não serve, varredura direta
+            for chave in self.chaves:
+                if chave in texto or texto in chave:
+                    return chave
+            return None
+        transicoes, falha, menor_por_estado = self._transicoes, self._falha, self._menor
+        estado = 0
+        menor = menor_por_estado[0]
+        for caractere in texto:
+            while estado and caractere not in transicoes[estado]:
+                estado = falha[estado]
+            estado = transicoes[estado].get(caractere, 0)
+            if menor_por_estado[estado] < menor:
+                menor = menor_por_estado[estado]
+        posicao = self._concatenadas.find(texto)
+        if posicao >= 0:
+            menor = min(menor, bisect_right(self._inicios, posicao) - 1)
+        return self.chaves[menor] if menor < len(self.chaves) else None
+
+# Buscas por substring nos mapeamentos de modelos (montadas uma vez no carregamento do módulo)
+_MOTOS_SUBSTRING = KeySubstringMatcher(MAPEAMENTO_MOTOS)
+_CATEGORIAS_SUBSTRING = KeySubstringMatcher(MAPEAMENTO_CATEGORIAS)
+
+def best_fuzzy_key(query: str, chaves: List[str], threshold: float) -> Optional[str]:
+    """
+    Chave com o maior max(partial_ratio, ratio) >= threshold (em empate, a primeira da lista).
+    As comparações rodam no process.extract do rapidfuzz, sem laço Python por chave.
+    """
+    scores: Dict[int, float] = {}
+    for scorer in (fuzz.partial_ratio, fuzz.ratio):
+        for _, score, indice in process.extract(query, chaves, scorer=scorer, limit=None, score_cutoff=threshold):
+            if score > scores.get(indice, -1):
+                scores[indice] = score
+    if not scores:
+        return None
+    return chaves[min(scores, key=lambda indice: (-scores[indice], indice))]
+
 @dataclass
 class SearchResult:
     vehicles: List[Dict[str, Any]]
@@ -72,6 +226,39 @@ class SearchResult:
 class VehicleSearchEngine:
     def __init__(self):
         self.exact_fields = ["tipo", "marca", "cambio", "motor", "portas"]
+        # Estruturas de busca da lista de veículos atual: (lista indexada, {chave da estrutura: estrutura})
+        self._search_indices: Tuple[Optional[List[Dict]], Dict[Tuple, Any]] = (None, {})
+
+    def _indices_for(self, vehicles: List[Dict]) -> Dict[Tuple, Any]:
+        """Estruturas de busca de uma lista de veículos (descartadas quando a lista muda)"""
+        origem, indices = self._search_indices
+        if origem is not vehicles:
+            indices = {}
+            self._search_indices = (vehicles, indices)
+        return indices
+
+    def _exact_field_index(self, vehicles: List[Dict], field: str) -> Dict[str, List[int]]:
+        """Índice invertido: posições dos veículos por valor normalizado do campo"""
+        indices = self._indices_for(vehicles)
+        indice = indices.get(("exato", field))
+        if indice is None:
+            indice = {}
+            for posicao, v in enumerate(vehicles):
+                indice.setdefault(self.normalize_text(str(v.get(field, ""))), []).append(posicao)
+            indices[("exato", field)] = indice
+        return indice
+
+    def _search_documents(self, vehicles: List[Dict], campos: Tuple[str, ...]) -> Tuple[List[Tuple], Dict[Tuple, List[int]]]:
+        """Documento de busca (tipo + campos em texto) de cada posição e as posições agrupadas por documento"""
+        indices = self._indices_for(vehicles)
+        resultado = indices.get(("documentos", campos))
+        if resultado is None:
+            documentos = [(v.get("tipo", ""),) + tuple(str(v.get(campo, "")) for campo in campos) for v in vehicles]
+            grupos: Dict[Tuple, List[int]] = {}
+            for posicao, documento in enumerate(documentos):
+                grupos.setdefault(documento, []).append(posicao)
+            resultado = indices[("documentos", campos)] = (documentos, grupos)
+        return resultado
 
     def _any_csv_value_matches(self, raw_val: str, field_val: str, vehicle_type: str, word_matcher):
         if not raw_val:
@@ -86,7 +273,7 @@ class VehicleSearchEngine:
     def normalize_text(self, text: str) -> str:
         if not text:
             return ""
-        return unidecode(str(text)).lower().replace("-", "").replace(" ", "").strip()
+        return _normalize_text(str(text))
 
     def convert_price(self, price_str: Any) -> Optional[float]:
         if not price_str:
@@ -94,8 +281,7 @@ class VehicleSearchEngine:
         try:
             if isinstance(price_str, (int, float)):
                 return float(price_str)
-            cleaned = str(price_str).replace(",", "").replace("R$", "").replace(".", "").strip()
-            return float(cleaned) / 100 if len(cleaned) > 2 else float(cleaned)
+            return _price_from_text(str(price_str))
         except (ValueError, TypeError):
             return None
 
@@ -103,17 +289,17 @@ class VehicleSearchEngine:
         if not year_str:
             return None
         try:
-            cleaned = str(year_str).strip().replace('\n', '').replace('\r', '').replace(' ', '')
-            return int(cleaned)
+            return _year_from_text(str(year_str))
         except (ValueError, TypeError):
             return None
 
     def convert_km(self, km_str: Any) -> Optional[int]:
         if not km_str:
             return None
+        if type(km_str) is int:
+            return km_str
         try:
-            cleaned = str(km_str).replace(".", "").replace(",", "").strip()
-            return int(cleaned)
+            return _km_from_text(str(km_str))
         except (ValueError, TypeError):
             return None
 
@@ -123,11 +309,7 @@ class VehicleSearchEngine:
         try:
             if isinstance(cc_str, (int, float)):
                 return float(cc_str)
-            cleaned = str(cc_str).replace(",", ".").replace("L", "").replace("l", "").strip()
-            value = float(cleaned)
-            if value < 10:
-                return value * 1000
-            return value
+            return _cc_from_text(str(cc_str))
         except (ValueError, TypeError):
             return None
 
@@ -158,9 +340,10 @@ class VehicleSearchEngine:
                 _, category = MAPEAMENTO_MOTOS[word]
                 return category
 
-        for key, (_, category) in MAPEAMENTO_MOTOS.items():
-            if key in normalized_model or normalized_model in key:
-                return category
+        key = _MOTOS_SUBSTRING.first_match(normalized_model)
+        if key is not None:
+            _, category = MAPEAMENTO_MOTOS[key]
+            return category
 
         if normalized_model in MAPEAMENTO_CATEGORIAS:
             return MAPEAMENTO_CATEGORIAS[normalized_model]
@@ -169,9 +352,9 @@ class VehicleSearchEngine:
             if len(word) >= 3 and word in MAPEAMENTO_CATEGORIAS:
                 return MAPEAMENTO_CATEGORIAS[word]
 
-        for key, category in MAPEAMENTO_CATEGORIAS.items():
-            if key in normalized_model or normalized_model in key:
-                return category
+        key = _CATEGORIAS_SUBSTRING.first_match(normalized_model)
+        if key is not None:
+            return MAPEAMENTO_CATEGORIAS[key]
 
         return None
 
@@ -187,48 +370,19 @@ class VehicleSearchEngine:
                 return False, f"exact_miss: '{normalized_word}' não encontrado"
         return True, f"exact_match: todas as palavras encontradas"
 
-    def _fuzzy_match_all_words(self, query_words: List[str], field_content: str, fuzzy_threshold: int) -> Tuple[bool, str]:
+    def _fuzzy_match_all_words(self, query_words: List[str], field_content: str) -> Tuple[bool, str]:
+        # Modo estrito (motos): toda palavra precisa estar no conteúdo. Prefixo/trecho de uma palavra
+        # do conteúdo já é trecho do conteúdo, então não há etapa extra por palavra do conteúdo
         normalized_content = self.normalize_text(field_content)
-        matched_words = []
         match_details = []
         for word in query_words:
             normalized_word = self.normalize_text(word)
             if len(normalized_word) < 2:
                 continue
-            word_matched = False
-            if normalized_word in normalized_content:
-                matched_words.append(normalized_word)
-                match_details.append(f"exact:{normalized_word}")
-                word_matched = True
-            elif not word_matched:
-                content_words = normalized_content.split()
-                for content_word in content_words:
-                    if content_word.startswith(normalized_word):
-                        matched_words.append(normalized_word)
-                        match_details.append(f"starts_with:{normalized_word}")
-                        word_matched = True
-                        break
-            elif not word_matched and len(normalized_word) >= 3:
-                content_words = normalized_content.split()
-                for content_word in content_words:
-                    if normalized_word in content_word:
-                        matched_words.append(normalized_word)
-                        match_details.append(f"substring:{normalized_word}>{content_word}")
-                        word_matched = True
-                        break
-            elif not word_matched and len(normalized_word) >= 3:
-                partial_score = fuzz.partial_ratio(normalized_content, normalized_word)
-                ratio_score = fuzz.ratio(normalized_content, normalized_word)
-                max_score = max(partial_score, ratio_score)
-                if max_score >= fuzzy_threshold:
-                    matched_words.append(normalized_word)
-                    match_details.append(f"fuzzy:{normalized_word}({max_score})")
-                    word_matched = True
-            if not word_matched:
+            if normalized_word not in normalized_content:
                 return False, f"moto_strict: palavra '{normalized_word}' não encontrada"
-        if len(matched_words) >= len([w for w in query_words if len(self.normalize_text(w)) >= 2]):
-            return True, f"moto_all_match: {', '.join(match_details)}"
-        return False, "moto_strict: nem todas as palavras encontradas"
+            match_details.append(f"exact:{normalized_word}")
+        return True, f"moto_all_match: {', '.join(match_details)}"
 
     def _fuzzy_match_any_word(self, query_words: List[str], field_content: str, fuzzy_threshold: int) -> Tuple[bool, str]:
         normalized_content = self.normalize_text(field_content)
@@ -256,10 +410,10 @@ class VehicleSearchEngine:
     def fuzzy_match(self, query_words: List[str], field_content: str, vehicle_type: str = None) -> Tuple[bool, str]:
         if not query_words or not field_content:
             return False, "empty_input"
-        fuzzy_threshold = 98 if vehicle_type == "moto" else 90
         if vehicle_type == "moto":
-            return self._fuzzy_match_all_words(query_words, field_content, fuzzy_threshold)
+            return self._fuzzy_match_all_words(query_words, field_content)
         else:
+            fuzzy_threshold = 90
             return self._fuzzy_match_any_word(query_words, field_content, fuzzy_threshold)
 
     def model_match(self, query_words: List[str], field_content: str, vehicle_type: str = None) -> Tuple[bool, str]:
@@ -290,35 +444,89 @@ class VehicleSearchEngine:
             return []
         return [v.strip() for v in str(value).split(',') if v.strip()]
 
-    def apply_filters(self, vehicles: List[Dict], filters: Dict[str, str]) -> List[Dict]:
+    def _exact_filter_positions(self, vehicles: List[Dict], filter_key: str, filter_value: str) -> set:
+        """Posições dos veículos cujo campo exato está entre os valores do filtro (via índice invertido)"""
+        indice = self._exact_field_index(vehicles, filter_key)
+        encontrados = set()
+        for normalized_val in {self.normalize_text(v) for v in self.split_multi_value(filter_value)}:
+            encontrados.update(indice.get(normalized_val, ()))
+        return encontrados
+
+    def _text_filter(self, filter_key: str, filter_value: str) -> Optional[Tuple[Tuple[str, ...], Callable[[Tuple], bool]]]:
+        """Campos do documento de busca e predicado de um filtro de texto; None para campos não filtrados"""
+        # Veículos com o mesmo documento (tipo + texto) têm o mesmo resultado: avaliado uma vez por documento
+        resultados: Dict[Tuple, bool] = {}
+        if filter_key == "modelo":
+            def matches(documento):
+                resultado = resultados.get(documento)
+                if resultado is None:
+                    vt = documento[0]
+                    resultado = resultados[documento] = any(
+                        self._any_csv_value_matches(filter_value, fv, vt, self.model_match) for fv in documento[1:]
+                    )
+                return resultado
+            return ("modelo", "titulo", "versao"), matches
+        if filter_key in ["cor", "categoria", "opcionais", "combustivel"]:
+            def matches(documento):
+                resultado = resultados.get(documento)
+                if resultado is None:
+                    resultado = resultados[documento] = self._any_csv_value_matches(filter_value, documento[1], documento[0], self.fuzzy_match)
+                return resultado
+            return (filter_key,), matches
+        return None
+
+    def apply_filters(self, vehicles: List[Dict], filters: Dict[str, str], per_filter: Optional[Dict[Tuple[str, str], set]] = None) -> List[Dict]:
+        """
+        Veículos que passam em todos os filtros, na ordem original.
+        Com per_filter (usado no fallback), as posições de cada filtro são calculadas uma vez sobre
+        a lista inteira e guardadas: remover um filtro só refaz a interseção dos conjuntos.
+        """
         if not filters:
             return vehicles
-        filtered_vehicles = list(vehicles)
+        if per_filter is not None:
+            conjuntos = []
+            for filter_key, filter_value in filters.items():
+                if not filter_value:
+                    continue
+                conjunto = per_filter.get((filter_key, filter_value))
+                if conjunto is None:
+                    if filter_key in self.exact_fields:
+                        conjunto = self._exact_filter_positions(vehicles, filter_key, filter_value)
+                    else:
+                        filtro = self._text_filter(filter_key, filter_value)
+                        if filtro is None:
+                            continue
+                        campos, matches = filtro
+                        conjunto = set()
+                        for documento, posicoes in self._search_documents(vehicles, campos)[1].items():
+                            if matches(documento):
+                                conjunto.update(posicoes)
+                    per_filter[(filter_key, filter_value)] = conjunto
+                conjuntos.append(conjunto)
+            if not conjuntos:
+                return list(vehicles)
+            conjuntos.sort(key=len)
+            return [vehicles[i] for i in sorted(conjuntos[0].intersection(*conjuntos[1:]))]
+
+        # Campos exatos pelo índice invertido: interseção das posições, mantendo a ordem original
+        posicoes = None
+        for filter_key in self.exact_fields:
+            filter_value = filters.get(filter_key)
+            if not filter_value:
+                continue
+            encontrados = self._exact_filter_positions(vehicles, filter_key, filter_value)
+            posicoes = encontrados if posicoes is None else posicoes & encontrados
+        selecionadas = range(len(vehicles)) if posicoes is None else sorted(posicoes)
+        # Filtros de texto só sobre as posições que restaram, lendo os documentos pré-calculados
         for filter_key, filter_value in filters.items():
-            if not filter_value or not filtered_vehicles:
+            if not filter_value or not selecionadas:
                 continue
-            if filter_key == "modelo":
-                def matches(v):
-                    vt = v.get("tipo", "")
-                    for field in ["modelo", "titulo", "versao"]:
-                        fv = str(v.get(field, ""))
-                        if self._any_csv_value_matches(filter_value, fv, vt, self.model_match):
-                            return True
-                    return False
-                filtered_vehicles = [v for v in filtered_vehicles if matches(v)]
-            elif filter_key in ["cor", "categoria", "opcionais", "combustivel"]:
-                def matches(v):
-                    vt = v.get("tipo", "")
-                    fv = str(v.get(filter_key, ""))
-                    return self._any_csv_value_matches(filter_value, fv, vt, self.fuzzy_match)
-                filtered_vehicles = [v for v in filtered_vehicles if matches(v)]
-            elif filter_key in self.exact_fields:
-                normalized_vals = [self.normalize_text(v) for v in self.split_multi_value(filter_value)]
-                filtered_vehicles = [
-                    v for v in filtered_vehicles
-                    if self.normalize_text(str(v.get(filter_key, ""))) in normalized_vals
-                ]
-        return filtered_vehicles
+            filtro = self._text_filter(filter_key, filter_value)
+            if filtro is not None:
+                campos, matches = filtro
+                documentos = self._search_documents(vehicles, campos)[0]
+                selecionadas = [i for i in selecionadas if matches(documentos[i])]
+        return [vehicles[i] for i in selecionadas]
 
     def apply_range_filters(self, vehicles: List[Dict], valormax: Optional[str], anomax: Optional[str], kmmax: Optional[str], ccmax: Optional[str]) -> List[Dict]:
         filtered_vehicles = list(vehicles)
@@ -378,6 +586,8 @@ class VehicleSearchEngine:
 
         current_filters = dict(filters)
         removed_filters = []
+        # Posições de cada filtro, calculadas uma vez e reaproveitadas a cada filtro removido
+        per_filter: Dict[Tuple[str, str], set] = {}
         current_valormax = valormax
         current_anomax = anomax
         current_kmmax = kmmax
@@ -385,7 +595,7 @@ class VehicleSearchEngine:
 
         for filter_to_remove in FALLBACK_PRIORITY:
             if filter_to_remove == "KmMax" and current_kmmax:
-                test_vehicles = self.apply_filters(vehicles, current_filters)
+                test_vehicles = self.apply_filters(vehicles, current_filters, per_filter)
                 vehicles_within_km_limit = [v for v in test_vehicles if self.convert_km(v.get("km")) is not None and self.convert_km(v.get("km")) <= int(current_kmmax)]
                 if not vehicles_within_km_limit:
                     current_kmmax = None
@@ -393,7 +603,7 @@ class VehicleSearchEngine:
                 else:
                     continue
             elif filter_to_remove == "AnoMax" and current_anomax:
-                test_vehicles = self.apply_filters(vehicles, current_filters)
+                test_vehicles = self.apply_filters(vehicles, current_filters, per_filter)
                 vehicles_within_year_limit = [v for v in test_vehicles if self.convert_year(v.get("ano")) is not None and self.convert_year(v.get("ano")) <= int(current_anomax)]
                 if not vehicles_within_year_limit:
                     current_anomax = None
@@ -408,7 +618,7 @@ class VehicleSearchEngine:
                         current_filters = {k: v for k, v in current_filters.items() if k != "modelo"}
                         current_filters["categoria"] = mapped_category
                         removed_filters.append(f"modelo({model_value})->categoria({mapped_category})")
-                        filtered_vehicles = self.apply_filters(vehicles, current_filters)
+                        filtered_vehicles = self.apply_filters(vehicles, current_filters, per_filter)
                         filtered_vehicles = self.apply_range_filters(filtered_vehicles, current_valormax, current_anomax, current_kmmax, current_ccmax)
                         if excluded_ids:
                             filtered_vehicles = [v for v in filtered_vehicles if str(v.get("id")) not in excluded_ids]
@@ -427,7 +637,7 @@ class VehicleSearchEngine:
             else:
                 continue
 
-            filtered_vehicles = self.apply_filters(vehicles, current_filters)
+            filtered_vehicles = self.apply_filters(vehicles, current_filters, per_filter)
             filtered_vehicles = self.apply_range_filters(filtered_vehicles, current_valormax, current_anomax, current_kmmax, current_ccmax)
             if excluded_ids:
                 filtered_vehicles = [v for v in filtered_vehicles if str(v.get("id")) not in excluded_ids]
@@ -442,8 +652,11 @@ search_engine = VehicleSearchEngine()
 def save_update_status(success: bool, message: str = "", vehicle_count: int = 0):
     status = {"timestamp": datetime.now().isoformat(), "success": success, "message": message, "vehicle_count": vehicle_count}
     try:
-        with open(STATUS_FILE, "w", encoding="utf-8") as f:
+        # Grava num arquivo temporário e substitui: leitores nunca veem o status pela metade
+        temporario = STATUS_FILE + ".tmp"
+        with open(temporario, "w", encoding="utf-8") as f:
             json.dump(status, f, ensure_ascii=False, indent=2)
+        os.replace(temporario, STATUS_FILE)
     except Exception as e:
         print(f"Erro ao salvar status: {e}")
 
@@ -463,13 +676,13 @@ def wrapped_fetch_and_convert_xml():
         vehicle_count = 0
         if os.path.exists("data.json"):
             try:
-                with open("data.json", "r", encoding="utf-8") as f:
-                    data = json.load(f)
-                    vehicle_count = len(data.get("veiculos", []))
+                # Já deixa o novo data.json no cache compartilhado pelos endpoints
+                vehicle_count = len(_load_cached_data().get("veiculos", []))
             except:
                 pass
         save_update_status(True, "Dados atualizados com sucesso", vehicle_count)
         print(f"Atualização concluída: {vehicle_count} veículos carregados")
+        refresh_list_cache()
     except Exception as e:
         error_message = f"Erro na atualização: {str(e)}"
         save_update_status(False, error_message)
@@ -482,8 +695,10 @@ def schedule_tasks():
     scheduler.start()
     wrapped_fetch_and_convert_xml()
 
+# Só dicionários e o autômato de substrings no caminho comum: roda direto no event loop;
+# a busca fuzzy (mais cara) vai para uma thread
 @app.get("/api/lookup")
-def lookup_model(request: Request):
+async def lookup_model(request: Request):
     query_params = dict(request.query_params)
     modelo = query_params.get("modelo", "").strip()
     tipo = query_params.get("tipo", "").strip().lower()
@@ -508,25 +723,16 @@ def lookup_model(request: Request):
                 cilindrada, categoria = MAPEAMENTO_MOTOS[word]
                 return JSONResponse(content={"modelo": modelo, "tipo": tipo, "cilindrada": cilindrada, "categoria": categoria, "match_type": "partial_word", "matched_word": word})
         
-        for key, (cilindrada, categoria) in MAPEAMENTO_MOTOS.items():
-            if key in normalized_model or normalized_model in key:
-                return JSONResponse(content={"modelo": modelo, "tipo": tipo, "cilindrada": cilindrada, "categoria": categoria, "match_type": "substring", "matched_key": key})
+        key = _MOTOS_SUBSTRING.first_match(normalized_model)
+        if key is not None:
+            cilindrada, categoria = MAPEAMENTO_MOTOS[key]
+            return JSONResponse(content={"modelo": modelo, "tipo": tipo, "cilindrada": cilindrada, "categoria": categoria, "match_type": "substring", "matched_key": key})
         
-        best_match = None
-        best_score = 0
         threshold = 85
-        
-        for key, (cilindrada, categoria) in MAPEAMENTO_MOTOS.items():
-            partial_score = fuzz.partial_ratio(normalized_model, key)
-            ratio_score = fuzz.ratio(normalized_model, key)
-            max_score = max(partial_score, ratio_score)
-            
-            if max_score >= threshold and max_score > best_score:
-                best_score = max_score
-                best_match = {"modelo": key, "tipo": tipo, "cilindrada": cilindrada, "categoria": categoria}
-        
-        if best_match:
-            return JSONResponse(content=best_match)
+        key = await asyncio.to_thread(best_fuzzy_key, normalized_model, _MOTOS_SUBSTRING.chaves, threshold)
+        if key is not None:
+            cilindrada, categoria = MAPEAMENTO_MOTOS[key]
+            return JSONResponse(content={"modelo": key, "tipo": tipo, "cilindrada": cilindrada, "categoria": categoria})
         
         return JSONResponse(content={"modelo": modelo, "tipo": tipo, "cilindrada": None, "categoria": None, "message": "Modelo de moto não encontrado nos mapeamentos"})
     
@@ -541,83 +747,175 @@ def lookup_model(request: Request):
                 categoria = MAPEAMENTO_CATEGORIAS[word]
                 return JSONResponse(content={"modelo": modelo, "tipo": tipo, "categoria": categoria, "match_type": "partial_word", "matched_word": word})
         
-        for key, categoria in MAPEAMENTO_CATEGORIAS.items():
-            if key in normalized_model or normalized_model in key:
-                return JSONResponse(content={"modelo": modelo, "tipo": tipo, "categoria": categoria, "match_type": "substring", "matched_key": key})
+        key = _CATEGORIAS_SUBSTRING.first_match(normalized_model)
+        if key is not None:
+            categoria = MAPEAMENTO_CATEGORIAS[key]
+            return JSONResponse(content={"modelo": modelo, "tipo": tipo, "categoria": categoria, "match_type": "substring", "matched_key": key})
         
-        best_match = None
-        best_score = 0
         threshold = 85
-        
-        for key, categoria in MAPEAMENTO_CATEGORIAS.items():
-            partial_score = fuzz.partial_ratio(normalized_model, key)
-            ratio_score = fuzz.ratio(normalized_model, key)
-            max_score = max(partial_score, ratio_score)
-            
-            if max_score >= threshold and max_score > best_score:
-                best_score = max_score
-                best_match = {"modelo": key, "tipo": tipo, "categoria": categoria}
-        
-        if best_match:
-            return JSONResponse(content=best_match)
+        key = await asyncio.to_thread(best_fuzzy_key, normalized_model, _CATEGORIAS_SUBSTRING.chaves, threshold)
+        if key is not None:
+            return JSONResponse(content={"modelo": key, "tipo": tipo, "categoria": MAPEAMENTO_CATEGORIAS[key]})
         
         return JSONResponse(content={"modelo": modelo, "tipo": tipo, "categoria": None, "message": "Modelo de carro não encontrado nos mapeamentos"})
 
-# MOVER ESTA FUNÇÃO PARA ANTES DO ENDPOINT /list
+# Colunas do /list, na ordem da linha de cada tipo de veículo
+_LIST_FIELDS_MOTO = ("id", "tipo", "marca", "modelo", "versao", "cor", "ano", "km", "combustivel", "cilindrada", "preco")
+_LIST_FIELDS_CARRO = ("id", "tipo", "marca", "modelo", "versao", "cor", "ano", "km", "combustivel", "cambio", "motor", "portas", "preco")
+
+def _csv_value(value: Any) -> str:
+    if value is None or value == "":
+        return ""
+    return str(value)
+
 def _format_vehicle(vehicle: Dict) -> str:
     tipo = vehicle.get("tipo", "").lower()
     
-    def safe_value(value):
-        if value is None or value == "":
-            return ""
-        return str(value)
-    
     opcionais_str = vehicle.get("opcionais", "")
     codigos_opcionais = opcionais_para_codigos(opcionais_str)
     codigos_formatados = f"[{','.join(map(str, codigos_opcionais))}]" if codigos_opcionais else "[]"
     
+    # Uma compreensão por linha sobre a tupla de colunas do tipo
+    get = vehicle.get
     if "moto" in tipo:
-        return ",".join([
-            safe_value(vehicle.get("id")),
-            safe_value(vehicle.get("tipo")),
-            safe_value(vehicle.get("marca")),
-            safe_value(vehicle.get("modelo")),
-            safe_value(vehicle.get("versao")),
-            safe_value(vehicle.get("cor")),
-            safe_value(vehicle.get("ano")),
-            safe_value(vehicle.get("km")),
-            safe_value(vehicle.get("combustivel")),
-            safe_value(vehicle.get("cilindrada")),
-            safe_value(vehicle.get("preco"))
-        ])
+        return ",".join([_csv_value(get(campo)) for campo in _LIST_FIELDS_MOTO])
     else:
-        return ",".join([
-            safe_value(vehicle.get("id")),
-            safe_value(vehicle.get("tipo")),
-            safe_value(vehicle.get("marca")),
-            safe_value(vehicle.get("modelo")),
-            safe_value(vehicle.get("versao")),
-            safe_value(vehicle.get("cor")),
-            safe_value(vehicle.get("ano")),
-            safe_value(vehicle.get("km")),
-            safe_value(vehicle.get("combustivel")),
-            safe_value(vehicle.get("cambio")),
-            safe_value(vehicle.get("motor")),
-            safe_value(vehicle.get("portas")),
-            safe_value(vehicle.get("preco")),
-            codigos_formatados
-        ])
+        valores = [_csv_value(get(campo)) for campo in _LIST_FIELDS_CARRO]
+        valores.append(codigos_formatados)
+        return ",".join(valores)
+
+def _load_json_file(path: str) -> Any:
+    """Lê um arquivo JSON direto dos bytes (orjson quando disponível)"""
+    with open(path, "rb") as f:
+        if orjson is not None and os.fstat(f.fileno()).st_size:
+            # orjson parseia o arquivo mapeado em memória, sem copiá-lo inteiro para o heap
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm, memoryview(mm) as buffer:
+                return orjson.loads(buffer)
+        content = f.read()
+    return orjson.loads(content) if orjson else json.loads(content)
+
+# Conteúdo de data.json já parseado, reaproveitado enquanto o arquivo não mudar
+_DATA_CACHE: Dict[str, Any] = {"mtime": None, "data": None, "list_index": None}
+_DATA_CACHE_LOCK = threading.Lock()
+
+def _load_cached_data() -> Any:
+    """Retorna data.json parseado, relendo o arquivo só quando ele é modificado"""
+    st = os.stat("data.json")
+    chave = (st.st_mtime_ns, st.st_size)
+    with _DATA_CACHE_LOCK:
+        if _DATA_CACHE["mtime"] != chave:
+            _DATA_CACHE["data"] = _load_json_file("data.json")
+            _DATA_CACHE["list_index"] = None
+            _DATA_CACHE["mtime"] = chave
+        return _DATA_CACHE["data"]
+
+def _format_vehicle_or_none(vehicle: Dict) -> Optional[str]:
+    """Formata o veículo; None quando falha (a requisição formata de novo e expõe o erro)"""
+    try:
+        return _format_vehicle(vehicle)
+    except Exception:
+        return None
+
+@dataclass
+class ListIndex:
+    """Dados pré-calculados do /list para uma versão de data.json"""
+    rows: List[Optional[str]]
+    # Posições dos veículos por categoria/tipo em minúsculas (None se algum valor não for texto)
+    por_categoria: Optional[Dict[str, List[int]]]
+    por_tipo: Optional[Dict[str, List[int]]]
+    # Chave (mtime, tamanho) do arquivo que originou o índice; base do ETag
+    versao: Optional[Tuple[int, int]] = None
+    # Corpo JSON já serializado por (categoria, tipo) filtrados
+    payloads: Dict[Tuple[str, str], bytes] = field(default_factory=dict)
+
+def _index_by_field(vehicles: List[Dict], campo: str) -> Optional[Dict[str, List[int]]]:
+    """Agrupa as posições dos veículos pelo valor do campo em minúsculas"""
+    indice: Dict[str, List[int]] = {}
+    try:
+        for posicao, v in enumerate(vehicles):
+            valor = v.get(campo)
+            if valor:
+                indice.setdefault(valor.lower(), []).append(posicao)
+    except AttributeError:
+        # Valor que não é texto: o filtro volta à varredura completa
+        return None
+    return indice
+
+def _cached_list_index(data: Any, vehicles: List[Dict]) -> ListIndex:
+    """Índice do /list, montado uma única vez por versão de data.json"""
+    with _DATA_CACHE_LOCK:
+        if _DATA_CACHE["data"] is data and _DATA_CACHE["list_index"] is not None:
+            return _DATA_CACHE["list_index"]
+    list_index = ListIndex(
+        rows=[_format_vehicle_or_none(v) for v in vehicles],
+        por_categoria=_index_by_field(vehicles, "categoria"),
+        por_tipo=_index_by_field(vehicles, "tipo"),
+    )
+    with _DATA_CACHE_LOCK:
+        if _DATA_CACHE["data"] is data:
+            list_index.versao = _DATA_CACHE["mtime"]
+            _DATA_CACHE["list_index"] = list_index
+    return list_index
+
+def refresh_list_cache():
+    """Recarrega data.json e o índice do /list logo após cada atualização do feed (fora das requisições)"""
+    try:
+        data = _load_cached_data()
+        vehicles = data.get("veiculos", [])
+        if isinstance(vehicles, list):
+            _cached_list_index(data, vehicles)
+    except FileNotFoundError:
+        pass
+    except Exception as e:
+        print(f"Erro ao pré-carregar data.json: {e}")
+
+def _list_etag(versao: Tuple[int, int], filter_categoria: str, filter_tipo: str) -> str:
+    """ETag do /list: muda junto com data.json e com os filtros"""
+    chave = f"{versao[0]}:{versao[1]}:{filter_categoria}:{filter_tipo}".encode("utf-8")
+    return '"' + hashlib.blake2b(chave, digest_size=16).hexdigest() + '"'
+
+def _etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Verifica se o If-None-Match do cliente já cobre o ETag atual"""
+    if not if_none_match:
+        return False
+    for candidato in if_none_match.split(","):
+        candidato = candidato.strip()
+        if candidato == "*" or candidato.removeprefix("W/") == etag:
+            return True
+    return False
+
+def _positions_matching(indice: Dict[str, List[int]], filtro: str) -> set:
+    """Posições cujo valor contém o filtro (percorre só as chaves distintas)"""
+    filtro = filtro.lower()
+    posicoes = set()
+    for chave, lista in indice.items():
+        if filtro in chave:
+            posicoes.update(lista)
+    return posicoes
+
+def _json_bytes(content: Any) -> bytes:
+    """Serializa em JSON compacto UTF-8 (orjson quando disponível, mesmo formato do JSONResponse)"""
+    if orjson is not None:
+        return orjson.dumps(content)
+    return json.dumps(content, ensure_ascii=False, allow_nan=False, indent=None, separators=(",", ":")).encode("utf-8")
+
+def _iter_json_object(content: Dict[str, Any]) -> Iterator[bytes]:
+    """Serializa um dict em pedaços (um por chave); concatenados, equivalem a _json_bytes(content)"""
+    separador = b"{"
+    for chave, valor in content.items():
+        yield separador + _json_bytes(chave) + b":" + _json_bytes(valor)
+        separador = b","
+    yield b"}" if separador == b"," else b"{}"
 
 @app.get("/list")
 def list_vehicles(request: Request):
-    if not os.path.exists("data.json"):
-        return JSONResponse(content={"error": "Nenhum dado disponível"}, status_code=404)
     try:
-        with open("data.json", "r", encoding="utf-8") as f:
-            data = json.load(f)
+        data = _load_cached_data()
         vehicles = data.get("veiculos", [])
         if not isinstance(vehicles, list):
             raise ValueError("Formato inválido: 'veiculos' deve ser uma lista")
+    except FileNotFoundError:
+        return JSONResponse(content={"error": "Nenhum dado disponível"}, status_code=404)
     except (json.JSONDecodeError, ValueError, KeyError) as e:
         return JSONResponse(content={"error": f"Erro ao carregar dados: {str(e)}"}, status_code=500)
 
@@ -625,25 +923,50 @@ def list_vehicles(request: Request):
     filter_categoria = query_params.get("categoria")
     filter_tipo = query_params.get("tipo")
 
-    filtered_vehicles = vehicles
-    if filter_categoria:
-        filtered_vehicles = [v for v in filtered_vehicles if v.get("categoria") and filter_categoria.lower() in v.get("categoria", "").lower()]
-    if filter_tipo:
-        filtered_vehicles = [v for v in filtered_vehicles if v.get("tipo") and filter_tipo.lower() in v.get("tipo", "").lower()]
+    # Cada veículo acompanhado da sua linha já formatada
+    list_index = _cached_list_index(data, vehicles)
+    rows = list_index.rows
+
+    # Mesma versão de data.json e mesmos filtros: 304 ou corpo já serializado
+    payload_key = (filter_categoria or "", filter_tipo or "")
+    etag = None
+    if list_index.versao is not None:
+        etag = _list_etag(list_index.versao, *payload_key)
+        if _etag_matches(request.headers.get("if-none-match"), etag):
+            return Response(status_code=304, headers={"ETag": etag})
+        payload = list_index.payloads.get(payload_key)
+        if payload is not None:
+            return Response(content=payload, media_type="application/json", headers={"ETag": etag})
+    if (filter_categoria and list_index.por_categoria is None) or (filter_tipo and list_index.por_tipo is None):
+        filtered_vehicles = zip(vehicles, rows)
+        if filter_categoria:
+            filtered_vehicles = [(v, row) for v, row in filtered_vehicles if v.get("categoria") and filter_categoria.lower() in v.get("categoria", "").lower()]
+        if filter_tipo:
+            filtered_vehicles = [(v, row) for v, row in filtered_vehicles if v.get("tipo") and filter_tipo.lower() in v.get("tipo", "").lower()]
+    elif filter_categoria or filter_tipo:
+        # Filtros pelo índice: o custo segue o tamanho do resultado, não do estoque
+        posicoes = None
+        if filter_categoria:
+            posicoes = _positions_matching(list_index.por_categoria, filter_categoria)
+        if filter_tipo:
+            posicoes_tipo = _positions_matching(list_index.por_tipo, filter_tipo)
+            posicoes = posicoes_tipo if posicoes is None else posicoes & posicoes_tipo
+        filtered_vehicles = [(vehicles[i], rows[i]) for i in sorted(posicoes)]
+    else:
+        filtered_vehicles = zip(vehicles, rows)
 
     categorized_vehicles = {}
     nao_mapeados = []
-    for vehicle in filtered_vehicles:
+    for vehicle, row in filtered_vehicles:
+        formatted_vehicle = row if row is not None else _format_vehicle(vehicle)
         categoria = vehicle.get("categoria")
         if not categoria or categoria in ["", "None", None]:
-            nao_mapeados.append(_format_vehicle(vehicle))
+            nao_mapeados.append(formatted_vehicle)
             continue
         if categoria not in categorized_vehicles:
             categorized_vehicles[categoria] = []
-        formatted_vehicle = _format_vehicle(vehicle)
         categorized_vehicles[categoria].append(formatted_vehicle)
 
-    # ADICIONAR ESTAS LINHAS AQUI:
     instruction_text = (
         "### COMO LER O JSON de 'BuscaEstoque' (CRUCIAL — leia cada linha com atenção)\n"
         "- Para motocicletas (se o segundo valor no JSON for 'moto'):\n"
@@ -667,7 +990,19 @@ def list_vehicles(request: Request):
     if nao_mapeados:
         result["NÃO MAPEADOS"] = nao_mapeados
 
-    return JSONResponse(content=result)
+    def stream_payload() -> Iterator[bytes]:
+        # Envia cada categoria assim que serializada e guarda o corpo completo para os próximos
+        partes = []
+        for parte in _iter_json_object(result):
+            partes.append(parte)
+            yield parte
+        if etag is not None:
+            if len(list_index.payloads) >= LIST_PAYLOAD_CACHE_SIZE:
+                list_index.payloads.clear()
+            list_index.payloads[payload_key] = b"".join(partes)
+
+    headers = {"ETag": etag} if etag is not None else None
+    return StreamingResponse(stream_payload(), media_type="application/json", headers=headers)
 
 def _collect_multi_params(qp: Any) -> Dict[str, str]:
     out: Dict[str, List[str]] = {}
@@ -684,16 +1019,29 @@ def _collect_multi_params(qp: Any) -> Dict[str, str]:
             out[key] = ",".join(acc)
     return out
 
+def _with_first_photo(vehicle: Dict) -> Dict:
+    """Cópia do veículo só com a primeira foto (os dicts de data.json em cache não são alterados)"""
+    fotos = vehicle.get("fotos")
+    if isinstance(fotos, list) and len(fotos) > 0:
+        if isinstance(fotos[0], str):
+            fotos = [fotos[0]]
+        elif isinstance(fotos[0], list) and len(fotos[0]) > 0:
+            fotos = [[fotos[0][0]]]
+        else:
+            fotos = []
+    else:
+        fotos = []
+    return {**vehicle, "fotos": fotos}
+
 @app.get("/api/data")
 def get_data(request: Request):
-    if not os.path.exists("data.json"):
-        return JSONResponse(content={"error": "Nenhum dado disponível", "resultados": [], "total_encontrado": 0}, status_code=404)
     try:
-        with open("data.json", "r", encoding="utf-8") as f:
-            data = json.load(f)
+        data = _load_cached_data()
         vehicles = data.get("veiculos", [])
         if not isinstance(vehicles, list):
             raise ValueError("Formato inválido: 'veiculos' deve ser uma lista")
+    except FileNotFoundError:
+        return JSONResponse(content={"error": "Nenhum dado disponível", "resultados": [], "total_encontrado": 0}, status_code=404)
     except (json.JSONDecodeError, ValueError, KeyError) as e:
         return JSONResponse(content={"error": f"Erro ao carregar dados: {str(e)}", "resultados": [], "total_encontrado": 0}, status_code=500)
 
@@ -732,17 +1080,7 @@ def get_data(request: Request):
         matched = [v for v in vehicles if str(v.get("id")) in id_set]
         if matched:
             if simples == "1":
-                for vehicle in matched:
-                    fotos = vehicle.get("fotos")
-                    if isinstance(fotos, list) and len(fotos) > 0:
-                        if isinstance(fotos[0], str):
-                            vehicle["fotos"] = [fotos[0]]
-                        elif isinstance(fotos[0], list) and len(fotos[0]) > 0:
-                            vehicle["fotos"] = [[fotos[0][0]]]
-                        else:
-                            vehicle["fotos"] = []
-                    else:
-                        vehicle["fotos"] = []
+                matched = [_with_first_photo(vehicle) for vehicle in matched]
             return JSONResponse(content={"resultados": matched, "total_encontrado": len(matched), "info": f"Veículos encontrados por IDs: {', '.join(sorted(id_set))}"})
         else:
             return JSONResponse(content={"resultados": [], "total_encontrado": 0, "error": f"Veículo(s) com ID {', '.join(sorted(id_set))} não encontrado(s)"})
@@ -753,33 +1091,13 @@ def get_data(request: Request):
         all_vehicles = [v for v in vehicles if str(v.get("id")) not in excluded_ids] if excluded_ids else list(vehicles)
         sorted_vehicles = sorted(all_vehicles, key=lambda v: search_engine.convert_price(v.get("preco")) or 0, reverse=True)
         if simples == "1":
-            for vehicle in sorted_vehicles:
-                fotos = vehicle.get("fotos")
-                if isinstance(fotos, list) and len(fotos) > 0:
-                    if isinstance(fotos[0], str):
-                        vehicle["fotos"] = [fotos[0]]
-                    elif isinstance(fotos[0], list) and len(fotos[0]) > 0:
-                        vehicle["fotos"] = [[fotos[0][0]]]
-                    else:
-                        vehicle["fotos"] = []
-                else:
-                    vehicle["fotos"] = []
+            sorted_vehicles = [_with_first_photo(vehicle) for vehicle in sorted_vehicles]
         return JSONResponse(content={"resultados": sorted_vehicles, "total_encontrado": len(sorted_vehicles), "info": "Exibindo todo o estoque disponível"})
 
     result = search_engine.search_with_fallback(vehicles, filters, valormax, anomax, kmmax, ccmax, excluded_ids)
 
     if simples == "1" and result.vehicles:
-        for vehicle in result.vehicles:
-            fotos = vehicle.get("fotos")
-            if isinstance(fotos, list) and len(fotos) > 0:
-                if isinstance(fotos[0], str):
-                    vehicle["fotos"] = [fotos[0]]
-                elif isinstance(fotos[0], list) and len(fotos[0]) > 0:
-                    vehicle["fotos"] = [[fotos[0][0]]]
-                else:
-                    vehicle["fotos"] = []
-            else:
-                vehicle["fotos"] = []
+        result.vehicles = [_with_first_photo(vehicle) for vehicle in result.vehicles]
 
     response_data = {"resultados": result.vehicles, "total_encontrado": result.total_found}
     if result.fallback_info:
@@ -2,9 +2,16 @@ import requests
 import xmltodict
 import json
 import os
+import re
 from datetime import datetime
 from typing import Dict, List, Any, Optional
 
+try:
+    # orjson (bem mais rápido, lê direto dos bytes) quando disponível
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads
+
 # Importa todos os parsers da pasta fetchers
 from fetchers import (
     AltimusParser,
@@ -29,6 +36,8 @@ from fetchers import (
 # =================== CONFIGURAÇÕES GLOBAIS =======================
 
 JSON_FILE = "data.json"
+# Tamanho dos blocos lidos da resposta HTTP (XML é parseado enquanto chega)
+STREAM_CHUNK_SIZE = 64 * 1024
 
 # =================== SISTEMA PRINCIPAL =======================
 
@@ -54,14 +63,52 @@ class UnifiedVehicleFetcher:
             CarburgoParser(),
             WordPressParser()
         ]
+        # Alternância compilada com os trechos de URL de todos os parsers,
+        # usada como filtro rápido antes de consultar parser por parser
+        self.url_pattern = re.compile("|".join(
+            re.escape(fragment) for parser in self.parsers for fragment in parser.URL_FRAGMENTS
+        ))
         print("[INFO] Sistema unificado iniciado com parsers modularizados")
     
     def get_urls(self) -> List[str]: 
         """Obtém todas as URLs das variáveis de ambiente"""
         return list({val for var, val in os.environ.items() if var.startswith("XML_URL") and val})
     
+    def read_feed(self, response: requests.Response, url: str) -> tuple[Any, str]:
+        """Lê o feed da resposta; XML é parseado durante o download"""
+        chunks = response.iter_content(chunk_size=STREAM_CHUNK_SIZE)
+        first = next(chunks, b"")
+        if not first.lstrip(b"\xef\xbb\xbf \t\r\n").startswith(b"<"):
+            return self.detect_format(first + b"".join(chunks), url)
+        
+        # Guarda os blocos recebidos para o fallback caso o parse direto falhe
+        received = [first]
+        def stream():
+            yield first
+            for chunk in chunks:
+                received.append(chunk)
+                yield chunk
+        try:
+            return xmltodict.parse(stream()), "xml"
+        except Exception:
+            # Completa o download e usa a detecção normal (ex.: bytes inválidos)
+            received.extend(chunks)
+            return self.detect_format(b"".join(received), url)
+    
     def detect_format(self, content: bytes, url: str) -> tuple[Any, str]:
         """Detecta se o conteúdo é JSON ou XML"""
+        # Parseia direto dos bytes (sem cópia decodificada do documento inteiro);
+        # o XML respeita a codificação declarada no próprio arquivo
+        try: 
+            return json_loads(content), "json"
+        except ValueError:
+            pass
+        try: 
+            return xmltodict.parse(content), "xml"
+        except Exception: 
+            pass
+        
+        # Fallback para feeds com bytes inválidos: decodifica ignorando erros
         content_str = content.decode('utf-8', errors='ignore')
         try: 
             return json.loads(content_str), "json"
@@ -73,9 +120,11 @@ class UnifiedVehicleFetcher:
     
     def select_parser(self, data: Any, url: str) -> Optional[object]:
         """Seleciona o parser apropriado baseado na URL"""
-        # Primeira prioridade: seleção baseada na URL
+        # Primeira prioridade: seleção baseada na URL (minúsculas calculadas uma vez)
+        url_lower = (url or "").lower()
+        url_match = self.url_pattern.search(url_lower) is not None
         for parser in self.parsers:
-            if parser.can_parse(data, url):
+            if (url_match and parser.matches_url(url_lower)) or parser.can_parse_data(data):
                 print(f"[INFO] Parser selecionado: {parser.__class__.__name__}")
                 return parser
         
@@ -94,9 +143,9 @@ class UnifiedVehicleFetcher:
         """Processa uma URL específica"""
         print(f"[INFO] Processando URL: {url}")
         try:
-            response = requests.get(url, timeout=30)
-            response.raise_for_status()
-            data, format_type = self.detect_format(response.content, url)
+            with requests.get(url, timeout=30, stream=True) as response:
+                response.raise_for_status()
+                data, format_type = self.read_feed(response, url)
             print(f"[INFO] Formato detectado: {format_type}")
             
             parser = self.select_parser(data, url)
@@ -135,8 +184,11 @@ class UnifiedVehicleFetcher:
         }
         
         try:
-            with open(JSON_FILE, "w", encoding="utf-8") as f: 
+            # Grava num arquivo temporário e substitui: quem lê (inclusive via mmap) nunca vê o arquivo pela metade
+            temporario = JSON_FILE + ".tmp"
+            with open(temporario, "w", encoding="utf-8") as f: 
                 json.dump(result, f, ensure_ascii=False, indent=2)
+            os.replace(temporario, JSON_FILE)
             print(f"\n[OK] Arquivo {JSON_FILE} salvo com sucesso!")
         except Exception as e: 
             print(f"[ERRO] Erro ao salvar arquivo JSON: {e}")